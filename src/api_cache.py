@@ -169,6 +169,91 @@ class APICache:
             logger.error(f"Failed to cache value: {e}")
             return False
     
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several cached values with one query.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Dictionary mapping each cached, unexpired key to its value
+        """
+        if not keys:
+            return {}
+        
+        try:
+            hashed = {self._generate_cache_key(key): key for key in keys}
+            now = datetime.now().isoformat()
+            placeholders = ', '.join('?' * len(hashed))
+            
+            with get_connection(self.db_path) as conn:
+                rows = conn.execute(f"""
+                    SELECT cache_key, cache_value FROM api_cache 
+                    WHERE cache_key IN ({placeholders}) AND expires_at > ?
+                """, (*hashed, now)).fetchall()
+                
+                if rows:
+                    # Update access statistics
+                    conn.executemany("""
+                        UPDATE api_cache 
+                        SET accessed_at = ?, access_count = access_count + 1
+                        WHERE cache_key = ?
+                    """, [(now, row['cache_key']) for row in rows])
+            
+            values = {hashed[row['cache_key']]: json.loads(row['cache_value']) for row in rows}
+            logger.debug(f"Cache hits for {len(values)}/{len(keys)} keys")
+            return values
+            
+        except Exception as e:
+            logger.error(f"Failed to get cached values: {e}")
+            return {}
+    
+    def set_many(self, items: Dict[str, Any], 
+                 duration_minutes: Optional[int] = None) -> bool:
+        """
+        Set several cached values in one transaction.
+        
+        Args:
+            items: Dictionary mapping cache keys to values
+            duration_minutes: Cache duration (uses default if None)
+            
+        Returns:
+            True if successfully cached, False otherwise
+        """
+        if not items:
+            return True
+        
+        try:
+            duration = duration_minutes or self.cache_duration_minutes
+            now = datetime.now()
+            expires_at = (now + timedelta(minutes=duration)).isoformat()
+            
+            rows = [
+                (self._generate_cache_key(key), json.dumps(value, default=str),
+                 expires_at, now.isoformat(), now.isoformat())
+                for key, value in items.items()
+            ]
+            
+            with get_db_transaction(self.db_path) as conn:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO api_cache 
+                    (cache_key, cache_value, expires_at, created_at, accessed_at)
+                    VALUES (?, ?, ?, ?, ?)
+                """, rows)
+            
+            logger.debug(f"Cached {len(rows)} values (expires: {expires_at})")
+            
+            # Clean up if cache is getting too large
+            if self._get_cache_size() > self.max_cache_size:
+                self._cleanup_cache()
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to cache values: {e}")
+            return False
+    
     def delete(self, key: str) -> bool:
         """
         Delete cached value by key.
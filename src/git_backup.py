@@ -274,8 +274,8 @@ class GitDatabaseBackup:
             True if restore successful or no action needed
         """
         try:
-            # Check if database already exists locally
-            if self.db_path.exists():
+            # Check if database already exists locally (an empty file has nothing to keep)
+            if self.db_path.exists() and self.db_path.stat().st_size > 0:
                 logger.info("Database file already exists locally")
                 return True
 
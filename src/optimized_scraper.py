@@ -5,6 +5,7 @@ This scraper removes unused extraction strategies and adds section-specific filt
 for more precise price monitoring.
 """
 
+import importlib.util
 import logging
 import os
 import time
@@ -19,11 +20,126 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 
+from .section_scraper import (
+    ACCESS_DENIED_JS, BLOCKED_URL_PATTERNS, get_shared_scraper, resolve_chromedriver_path
+)
+
 logger = logging.getLogger(__name__)
 
+# BeautifulSoup tree builder: lxml's C parser is several times faster than the
+# pure-Python parser, which is only used if lxml is not installed
+_HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# Scrollable containers that hold the pricing list, as one CSS selector list
+_PRICING_CONTAINER_SELECTOR = ', '.join([
+    '[data-bdd="qp-split-scroll"]',
+    '[data-testid="qp-split-scroll"]',
+    '[data-bdd*="scroll"]',
+    '[data-testid*="scroll"]',
+    '.pricing-container',
+    '.ticket-options',
+    '[class*="pricing"]'
+])
+
+# True once the rendered page text mentions General Admission; reads innerText
+# in-page instead of fetching .text for every element over WebDriver
+_HAS_GENERAL_ADMISSION_JS = """
+return !!document.body && document.body.innerText.toLowerCase().includes('general adm');
+"""
+
+# Number of elements matching a selector
+_PRICE_COUNT_JS = "return document.querySelectorAll(arguments[0]).length;"
+
+# Seconds a scroll step waits for more prices to render before moving on
+_SCROLL_LOAD_TIMEOUT = 3
+
+# Elements that may hold a price, as one CSS selector list so each element is
+# visited once even when it matches several patterns
+_PRICE_ELEMENT_SELECTOR = ', '.join([
+    '[class*="price"]',
+    '[class*="Price"]',
+    '[data-price]',
+    '[class*="cost"]',
+    '[class*="amount"]'
+])
+
+# Ancestor levels of a price element searched for its section name
+_SECTION_CONTEXT_DEPTH = 3
+
+# outerHTML of the price elements together with the ancestors searched for their
+# section names, so the whole document is not serialised over WebDriver.
+# Nested candidates are dropped so each element is sent once, in document order.
+_PRICING_FRAGMENT_JS = """
+const roots = new Set();
+for (const el of document.querySelectorAll(arguments[0])) {
+    let root = el;
+    for (let i = 0; i < arguments[1] && root.parentElement; i++) {
+        root = root.parentElement;
+    }
+    roots.add(root);
+}
+const html = [];
+for (const root of roots) {
+    let nested = false;
+    for (let p = root.parentElement; p && !nested; p = p.parentElement) {
+        nested = roots.has(p);
+    }
+    if (!nested) {
+        html.push(root.outerHTML);
+    }
+}
+return html.join('');
+"""
+
+# Words in an element's text that suggest it names a seating section
+_SECTION_KEYWORDS = (
+    'general admission', 'ga', 'floor', 'pit', 'vip', 'premium',
+    'section', 'sec', 'row', 'level', 'tier', 'balcony', 'mezzanine',
+    'orchestra', 'loge', 'box', 'suite', 'reserved', 'lawn'
+)
+
+# Section labels such as "Sec 101" or "Level B"
+_SECTION_LABEL_RE = re.compile(r'(sec|section|level|tier)\s*([a-z0-9]+)', re.IGNORECASE)
+
+# First number in a cleaned price string, and the first run of digits in a section name
+_PRICE_NUMBER_RE = re.compile(r'([0-9]+(?:\.[0-9]{1,2})?)')
+_DIGITS_RE = re.compile(r'(\d+)')
+
+# Common "Accept" button patterns for the consent popup, as one CSS selector list.
+# Text-based matches (CSS has no :contains) are left to the XPath fallback.
+_ACCEPT_BUTTON_SELECTOR = ', '.join([
+    'button[data-testid*="accept"]',
+    'button[aria-label*="accept" i]',
+    '[data-bdd*="accept"]',
+    'button.accept',
+    '#accept-button'
+])
+
+# Free space /dev/shm needs before temporary profiles are placed there;
+# container defaults (64 MB) are too small for Chrome's caches
+_SHM_MIN_FREE_BYTES = 512 * 1024 * 1024
+
+
+def _ephemeral_profile_parent() -> Optional[str]:
+    """
+    Pick where temporary Chrome profiles are created.
+    
+    Returns:
+        /dev/shm when it is a writable RAM disk with room to spare,
+        otherwise None for the system temp directory
+    """
+    shm = '/dev/shm'
+    try:
+        if os.path.isdir(shm) and os.access(shm, os.W_OK):
+            stats = os.statvfs(shm)
+            if stats.f_bavail * stats.f_frsize >= _SHM_MIN_FREE_BYTES:
+                return shm
+    except (OSError, AttributeError):
+        pass
+    return None
+
 
 class TicketmasterOptimizedScraper:
     """
@@ -33,16 +149,21 @@ class TicketmasterOptimizedScraper:
     support for targeting specific seating sections.
     """
     
-    def __init__(self, headless: bool = True, timeout: int = 30):
+    def __init__(self, headless: bool = True, timeout: int = 30,
+                 profile_dir: Optional[str] = None):
         """
         Initialize the optimized scraper.
         
         Args:
             headless: Run browser in headless mode
             timeout: Page load timeout in seconds
+            profile_dir: Persistent Chrome profile directory, kept between runs
+                         so the HTTP and DNS caches stay warm. A temporary
+                         profile is created and removed on close if None.
         """
         self.headless = headless
         self.timeout = timeout
+        self.profile_dir = profile_dir
         self.driver = None
         self._temp_profile_dir = None
         self._setup_driver()
@@ -64,13 +185,23 @@ class TicketmasterOptimizedScraper:
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
 
-            # Unique user data directory to avoid conflicts (essential for Codespaces)
-            self._temp_profile_dir = tempfile.mkdtemp(prefix=f"chrome_profile_{uuid.uuid4().hex[:8]}_")
-            options.add_argument(f"--user-data-dir={self._temp_profile_dir}")
-            logger.debug(f"Using temporary Chrome profile directory: {self._temp_profile_dir}")
+            if self.profile_dir:
+                # Persistent profile keeps the browser caches warm across runs
+                os.makedirs(self.profile_dir, exist_ok=True)
+                options.add_argument(f"--user-data-dir={self.profile_dir}")
+                logger.debug(f"Using Chrome profile directory: {self.profile_dir}")
+            else:
+                # Unique user data directory to avoid conflicts (essential for Codespaces)
+                self._temp_profile_dir = tempfile.mkdtemp(prefix=f"chrome_profile_{uuid.uuid4().hex[:8]}_",
+                                                          dir=_ephemeral_profile_parent())
+                options.add_argument(f"--user-data-dir={self._temp_profile_dir}")
+                logger.debug(f"Using temporary Chrome profile directory: {self._temp_profile_dir}")
 
             # Optimized options for Ticketmaster (based on our testing)
-            options.add_argument("--disable-images")  # Major speed boost
+            options.add_argument("--blink-settings=imagesEnabled=false")  # Major speed boost
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2
+            })
             # Note: JavaScript enabled for dynamic pricing content
             options.add_argument("--disable-gpu")
             options.add_argument("--disable-extensions")
@@ -82,9 +213,21 @@ class TicketmasterOptimizedScraper:
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
             
-            service = Service(ChromeDriverManager().install())
+            # Return from get() at DOMContentLoaded; pricing content is waited for explicitly
+            options.page_load_strategy = "eager"
+            
+            service = Service(resolve_chromedriver_path())
             self.driver = webdriver.Chrome(service=service, options=options)
             self.driver.set_page_load_timeout(self.timeout)
+            # Lookups that miss must fail at once; all waiting uses explicit WebDriverWaits
+            self.driver.implicitly_wait(0)
+            
+            # Prices are read from the DOM, so drop media, fonts and trackers on the wire
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                logger.debug(f"Could not block unused resources: {e}")
             
             logger.debug("Chrome WebDriver initialized with optimized settings")
             
@@ -127,11 +270,14 @@ class TicketmasterOptimizedScraper:
             # Navigate and wait for content
             logger.debug(f"Loading page: {event_url}")
             self.driver.get(event_url)
-            time.sleep(random.uniform(2, 4))
             
-            # Check for access issues
-            page_source = self.driver.page_source
-            if "Access to this page has been denied" in page_source:
+            # Wait for the document to be parsed instead of a fixed delay
+            WebDriverWait(self.driver, self.timeout).until(
+                lambda driver: driver.execute_script("return document.readyState") != "loading"
+            )
+            
+            # Check for access issues in-page rather than serialising the DOM
+            if self.driver.execute_script(ACCESS_DENIED_JS):
                 raise Exception("Access denied - bot detection")
             
             # Handle initial popup if present
@@ -140,9 +286,8 @@ class TicketmasterOptimizedScraper:
             # Simulate scrolling within pricing div to load dynamic content
             self._load_dynamic_content()
             
-            # Get updated page source after scrolling
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            # Parse the updated page after scrolling
+            soup = self._read_pricing_html()
             
             # Extract section-specific pricing
             section_prices = self._extract_section_prices(soup, target_sections)
@@ -184,39 +329,21 @@ class TicketmasterOptimizedScraper:
         logger.debug("Checking for and handling initial popup")
         
         try:
-            # Look for common "Accept" button patterns
-            accept_selectors = [
-                'button[data-testid*="accept"]',
-                'button[aria-label*="accept"]',
-                'button[aria-label*="Accept"]',
-                'button:contains("Accept")',
-                '[data-bdd*="accept"]',
-                '.modal button:contains("Accept")',
-                '.popup button:contains("Accept")',
-                'button.accept',
-                '#accept-button'
-            ]
-            
-            for selector in accept_selectors:
-                try:
-                    # Wait up to 5 seconds for the Accept button to appear
-                    accept_button = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    
-                    logger.debug(f"Found Accept button with selector: {selector}")
-                    accept_button.click()
-                    logger.info("Successfully clicked Accept button")
-                    
-                    # Wait for popup to dismiss
-                    time.sleep(random.uniform(1, 2))
-                    return
-                    
-                except TimeoutException:
-                    continue
-                except Exception as e:
-                    logger.debug(f"Error with selector {selector}: {e}")
-                    continue
+            # Poll all "Accept" button patterns at once with a single 5 second budget
+            try:
+                accept_button = WebDriverWait(self.driver, 5).until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, _ACCEPT_BUTTON_SELECTOR))
+                )
+                accept_button.click()
+                logger.info("Successfully clicked Accept button")
+                
+                self._wait_for_dismissal(accept_button)
+                return
+                
+            except TimeoutException:
+                pass
+            except Exception as e:
+                logger.debug(f"Error clicking Accept button: {e}")
             
             # Also try JavaScript-based approach for text content
             try:
@@ -224,7 +351,7 @@ class TicketmasterOptimizedScraper:
                 if accept_button.is_enabled() and accept_button.is_displayed():
                     accept_button.click()
                     logger.info("Successfully clicked Accept button via XPath")
-                    time.sleep(random.uniform(1, 2))
+                    self._wait_for_dismissal(accept_button)
                     return
             except Exception:
                 pass
@@ -235,37 +362,41 @@ class TicketmasterOptimizedScraper:
             logger.warning(f"Error handling popup: {e}")
             # Continue anyway - popup might not be present
     
+    def _wait_for_dismissal(self, accept_button) -> None:
+        """
+        Wait for a clicked Accept button to disappear along with its popup.
+        
+        Args:
+            accept_button: The button that was clicked
+        """
+        try:
+            WebDriverWait(self.driver, 5).until(EC.invisibility_of_element(accept_button))
+        except TimeoutException:
+            logger.debug("Accept button still visible after click")
+    
     def _load_dynamic_content(self) -> None:
         """
         Simulate scrolling within the pricing div to load dynamic pricing content.
         
         Ticketmaster loads pricing information dynamically as users scroll within
-        the specific pricing container div.
+        the specific pricing container div. After each scroll step the page is
+        watched for newly rendered prices instead of sleeping a fixed time.
         """
         logger.debug("Loading dynamic content through pricing div scrolling simulation")
         
         try:
-            # First, try to find the pricing div
+            # First, try to find the pricing div with one 5 second wait for any candidate
             pricing_div = None
-            pricing_selectors = [
-                '[data-bdd="qp-split-scroll"]',
-                '[data-testid="qp-split-scroll"]',
-                '[data-bdd*="scroll"]',
-                '[data-testid*="scroll"]',
-                '.pricing-container',
-                '.ticket-options',
-                '[class*="pricing"]'
-            ]
-            
-            for selector in pricing_selectors:
-                try:
-                    pricing_div = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    logger.debug(f"Found pricing div with selector: {selector}")
-                    break
-                except TimeoutException:
-                    continue
+            try:
+                pricing_div = WebDriverWait(self.driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _PRICING_CONTAINER_SELECTOR))
+                )
+                logger.debug("Found pricing div")
+            except TimeoutException:
+                pass
+            
+            scroll_positions = [0.25, 0.5, 0.75, 1.0]
+            price_count = 0
             
             if pricing_div:
                 # Scroll within the pricing div
@@ -276,8 +407,6 @@ class TicketmasterOptimizedScraper:
                 div_client_height = self.driver.execute_script("return arguments[0].clientHeight", pricing_div)
                 
                 # Scroll down in stages within the div
-                scroll_positions = [0.25, 0.5, 0.75, 1.0]
-                
                 for position in scroll_positions:
                     scroll_to = int((div_height - div_client_height) * position)
                     
@@ -285,48 +414,41 @@ class TicketmasterOptimizedScraper:
                     self.driver.execute_script("arguments[0].scrollTop = arguments[1];", pricing_div, scroll_to)
                     
                     # Wait for content to load
-                    time.sleep(random.uniform(2, 4))
-                    
-                    # Check for General Admission elements specifically
-                    try:
-                        ga_elements = self.driver.find_elements(By.XPATH, "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'general admission') or contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'general adm')]")
-                        if ga_elements:
-                            logger.info(f"Found {len(ga_elements)} General Admission elements after scrolling to {position*100:.0f}%")
-                            # Wait a bit longer for GA pricing to fully load
-                            time.sleep(random.uniform(3, 5))
-                    except Exception:
-                        pass
+                    new_count = self._wait_for_more_prices(price_count)
+                    logger.debug(f"Scrolled pricing div to {position*100:.0f}%, {new_count} price elements")
                     
-                    logger.debug(f"Scrolled pricing div to {position*100:.0f}%")
+                    # Prices were already rendered, or this step loaded none; skip to the bottom
+                    if new_count == price_count:
+                        break
+                    price_count = new_count
                 
                 # Final scroll to bottom of div
                 self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", pricing_div)
-                time.sleep(random.uniform(3, 5))
+                self._wait_for_more_prices(price_count)
                 
             else:
                 # Fallback to page scrolling if pricing div not found
                 logger.warning("Pricing div not found, falling back to page scrolling")
                 
                 initial_height = self.driver.execute_script("return document.body.scrollHeight")
-                scroll_positions = [0.25, 0.5, 0.75, 1.0]
                 
                 for position in scroll_positions:
                     scroll_to = int(initial_height * position)
-                    self.driver.execute_script(f"window.scrollTo(0, {scroll_to});")
-                    time.sleep(random.uniform(2, 4))
+                    self.driver.execute_script("window.scrollTo(0, arguments[0]);", scroll_to)
+                    
+                    new_count = self._wait_for_more_prices(price_count)
+                    if new_count == price_count:
+                        break
+                    price_count = new_count
                 
                 # Final page scroll
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(random.uniform(3, 5))
+                self._wait_for_more_prices(price_count)
             
             # Final check for General Admission content
             try:
                 WebDriverWait(self.driver, 10).until(
-                    lambda driver: any(
-                        'general admission' in elem.text.lower() or 'general adm' in elem.text.lower()
-                        for elem in driver.find_elements(By.CSS_SELECTOR, '*')
-                        if elem.text.strip()
-                    )
+                    lambda driver: driver.execute_script(_HAS_GENERAL_ADMISSION_JS)
                 )
                 logger.info("Successfully found General Admission elements after scrolling")
             except TimeoutException:
@@ -337,6 +459,53 @@ class TicketmasterOptimizedScraper:
             logger.warning(f"Error during dynamic content loading: {e}")
             # Continue with static content if dynamic loading fails
     
+    def _wait_for_more_prices(self, previous_count: int) -> int:
+        """
+        Wait until more price elements are rendered than before a scroll step.
+        
+        Args:
+            previous_count: Number of price elements before scrolling
+            
+        Returns:
+            Number of price elements when the wait ended
+        """
+        count = previous_count
+        
+        def more_prices(driver):
+            nonlocal count
+            count = driver.execute_script(_PRICE_COUNT_JS, _PRICE_ELEMENT_SELECTOR)
+            return count > previous_count
+        
+        try:
+            WebDriverWait(self.driver, _SCROLL_LOAD_TIMEOUT, poll_frequency=0.25).until(more_prices)
+        except TimeoutException:
+            pass
+        
+        # Small jitter so scroll steps do not follow a fixed rhythm
+        time.sleep(random.uniform(0.2, 0.6))
+        return count
+    
+    def _read_pricing_html(self) -> BeautifulSoup:
+        """
+        Fetch and parse the price-bearing parts of the loaded page.
+        
+        Only the price elements and the ancestors searched for their section
+        names are sent back from the browser. The extraction uses the same
+        selector, so a page without matches has no prices to find.
+        
+        Returns:
+            BeautifulSoup tree to extract prices from (empty if the page has
+            no price elements)
+        """
+        fragment = self.driver.execute_script(
+            _PRICING_FRAGMENT_JS, _PRICE_ELEMENT_SELECTOR, _SECTION_CONTEXT_DEPTH
+        ) or ''
+        if fragment:
+            logger.debug(f"Read {len(fragment)} characters of pricing HTML")
+        else:
+            logger.debug("No price elements found in page")
+        return BeautifulSoup(fragment, _HTML_PARSER)
+    
     def _extract_section_prices(self, soup: BeautifulSoup, target_sections: Optional[List[str]] = None) -> Dict[str, Dict]:
         """
         Extract prices organized by seating section.
@@ -351,18 +520,7 @@ class TicketmasterOptimizedScraper:
         section_pricing = {}
         
         # Optimized selectors based on our Ticketmaster analysis
-        price_selectors = [
-            '[class*="price"]',
-            '[class*="Price"]', 
-            '[data-price]',
-            '[class*="cost"]',
-            '[class*="amount"]'
-        ]
-        
-        all_price_elements = []
-        for selector in price_selectors:
-            elements = soup.select(selector)
-            all_price_elements.extend(elements)
+        all_price_elements = soup.select(_PRICE_ELEMENT_SELECTOR)
         
         logger.debug(f"Found {len(all_price_elements)} potential price elements")
         
@@ -435,28 +593,23 @@ class TicketmasterOptimizedScraper:
         """
         # Strategy 1: Check element's own text for section keywords
         element_text = element.get_text(strip=True)
-        section_keywords = [
-            'general admission', 'ga', 'floor', 'pit', 'vip', 'premium', 
-            'section', 'sec', 'row', 'level', 'tier', 'balcony', 'mezzanine',
-            'orchestra', 'loge', 'box', 'suite', 'reserved', 'lawn'
-        ]
-        
-        for keyword in section_keywords:
-            if keyword in element_text.lower():
-                # Extract the relevant part
-                if 'general admission' in element_text.lower() or 'ga' in element_text.lower():
-                    return 'General Admission'
-                elif 'floor' in element_text.lower():
-                    return 'Floor'
-                elif 'vip' in element_text.lower():
-                    return 'VIP'
-                elif 'premium' in element_text.lower():
-                    return 'Premium'
-                # Add more specific patterns as needed
+        element_lower = element_text.lower()
+        
+        if any(keyword in element_lower for keyword in _SECTION_KEYWORDS):
+            # Extract the relevant part
+            if 'general admission' in element_lower or 'ga' in element_lower:
+                return 'General Admission'
+            elif 'floor' in element_lower:
+                return 'Floor'
+            elif 'vip' in element_lower:
+                return 'VIP'
+            elif 'premium' in element_lower:
+                return 'Premium'
+            # Add more specific patterns as needed
         
         # Strategy 2: Look in parent elements (up to 3 levels)
         current = element.parent
-        for level in range(3):
+        for level in range(_SECTION_CONTEXT_DEPTH):
             if not current:
                 break
                 
@@ -475,7 +628,7 @@ class TicketmasterOptimizedScraper:
             current = current.parent
         
         # Strategy 3: Parse section from element text patterns
-        section_match = re.search(r'(sec|section|level|tier)\s*([a-z0-9]+)', element_text, re.IGNORECASE)
+        section_match = _SECTION_LABEL_RE.search(element_text)
         if section_match:
             return f"Section {section_match.group(2).upper()}"
         
@@ -519,7 +672,7 @@ class TicketmasterOptimizedScraper:
             
             # Handle range patterns (e.g., "100s" matches sections 101-109)
             if target_lower.endswith('s') and target_lower[:-1].isdigit():
-                section_num_match = re.search(r'(\d+)', section_name)
+                section_num_match = _DIGITS_RE.search(section_name)
                 if section_num_match:
                     section_num = int(section_num_match.group(1))
                     range_start = int(target_lower[:-1]) * 10
@@ -546,7 +699,7 @@ class TicketmasterOptimizedScraper:
         cleaned = str(price_str).strip().replace(',', '').replace('$', '')
         
         # Extract number pattern
-        match = re.search(r'([0-9]+(?:\.[0-9]{1,2})?)', cleaned)
+        match = _PRICE_NUMBER_RE.search(cleaned)
         if match:
             try:
                 price = float(match.group(1))
@@ -558,6 +711,20 @@ class TicketmasterOptimizedScraper:
         
         return None
     
+    @classmethod
+    def get_shared(cls, headless: bool = True, timeout: int = 30) -> 'TicketmasterOptimizedScraper':
+        """
+        Return the process-wide optimized scraper for these settings; see get_shared_scraper.
+        
+        Args:
+            headless: Run browser in headless mode
+            timeout: Page load timeout in seconds
+            
+        Returns:
+            Shared TicketmasterOptimizedScraper instance
+        """
+        return get_shared_scraper(cls, headless, timeout)
+    
     def get_general_admission_prices(self, event_url: str) -> Dict[str, Any]:
         """
         Convenience method to get General Admission prices specifically.
@@ -26,6 +26,9 @@ from .config_manager import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# Browser sessions used at once when several events need section scraping
+SCRAPE_CONCURRENCY = 2
+
 
 class PriceMonitor:
     """
@@ -55,6 +58,7 @@ class PriceMonitor:
         self.enable_scraping = enable_scraping
         self.scraper = None
         self.section_scraper = None
+        self._prefetched_scrapes: Dict[str, Dict[str, Any]] = {}
 
         # Load configuration for sections
         self.config_manager = ConfigManager(config_path) if config_path else None
@@ -150,6 +154,14 @@ class PriceMonitor:
             'results': []
         }
 
+        # Fetch every configured event in one API call; the per-concert
+        # lookups below are then served from the cache
+        self.api_client.get_events_bulk(list(configured_concerts))
+
+        # Scrape the events that will need it on several browsers at once;
+        # the per-concert checks below then use these results
+        self._prefetch_section_prices(list(configured_concerts))
+
         # Process each configured concert
         for event_id, threshold_price in configured_concerts.items():
             try:
@@ -191,7 +203,80 @@ class PriceMonitor:
                    f"{results['prices_checked']}/{results['total_concerts']} prices found, "
                    f"{results['alerts_sent']} alerts sent, {results['errors']} errors")
 
+        self._prefetched_scrapes = {}
         return results
+
+    def _prefetch_section_prices(self, event_ids: List[str]) -> None:
+        """
+        Scrape section prices for events the API has no pricing for, in parallel.
+
+        Only events with section preferences are scraped here. Results are kept
+        for _scrape_event_prices, which scrapes again only if a result is missing
+        or failed.
+
+        Args:
+            event_ids: Ticketmaster event IDs about to be checked
+        """
+        if not self.enable_scraping:
+            return
+
+        urls_sections = []
+        event_ids_by_url = {}
+        for event_id in event_ids:
+            if event_id not in self.section_preferences:
+                continue
+            if self._api_min_price(self.api_client.get_event_details(event_id)):
+                continue
+            event_url = self._event_url(event_id)
+            urls_sections.append((event_url, self.section_preferences[event_id]))
+            event_ids_by_url[event_url] = event_id
+
+        # A single event gains nothing over the shared scraper
+        if len(urls_sections) < 2:
+            return
+
+        try:
+            results = SectionBasedScraper.scrape_events(
+                urls_sections, concurrency=SCRAPE_CONCURRENCY, headless=True
+            )
+        except Exception as e:
+            logger.warning(f"Parallel section scraping failed: {e}")
+            return
+
+        for event_url, result in results.items():
+            self._prefetched_scrapes[event_ids_by_url[event_url]] = result
+
+    @staticmethod
+    def _api_min_price(event_details: Optional[Dict[str, Any]]) -> Optional[Decimal]:
+        """
+        Get the lowest ticket price the API returned for an event.
+
+        Args:
+            event_details: Parsed event details from TicketmasterAPI.get_event_details
+
+        Returns:
+            Minimum price, or None if the API has no pricing for the event
+        """
+        prices = [entry['price'] for entry in (event_details or {}).get('prices', [])]
+        if not prices:
+            return None
+        return Decimal(str(min(prices)))
+
+    def _event_url(self, event_id: str) -> str:
+        """
+        Get the Ticketmaster page URL for an event.
+
+        Args:
+            event_id: Ticketmaster event ID
+
+        Returns:
+            The URL from the API, or one constructed from the event ID
+        """
+        event_details = self.api_client.get_event_details(event_id)
+        if event_details and event_details.get('url'):
+            return event_details['url']
+        # Fallback to constructed URL
+        return f"https://www.ticketmaster.com/event/{event_id}"
     
     def _check_concert_price(self, concert: Concert) -> Dict[str, Any]:
         """
@@ -224,14 +309,10 @@ class PriceMonitor:
             data_source = 'api'
             
             event_details = self.api_client.get_event_details(concert.event_id)
-            if event_details and event_details.get('priceRanges'):
-                # Extract minimum price (most relevant for alerts)
-                price_ranges = event_details['priceRanges']
-                min_price = min(float(pr.get('min', float('inf'))) for pr in price_ranges if pr.get('min'))
-                
-                if min_price != float('inf'):
-                    current_price = Decimal(str(min_price))
-                    logger.debug(f"API pricing found for {concert.name}: ${current_price}")
+            # Extract minimum price (most relevant for alerts)
+            current_price = self._api_min_price(event_details)
+            if current_price:
+                logger.debug(f"API pricing found for {concert.name}: ${current_price}")
             
             # Fallback to web scraping if API didn't provide pricing
             section_prices = {}
@@ -382,13 +463,7 @@ class PriceMonitor:
             Dictionary mapping section names to prices (Decimal)
         """
         try:
-            # First try to get the proper URL from API
-            event_details = self.api_client.get_event_details(event_id)
-            if event_details and event_details.get('url'):
-                event_url = event_details['url']
-            else:
-                # Fallback to constructed URL
-                event_url = f"https://www.ticketmaster.com/event/{event_id}"
+            event_url = self._event_url(event_id)
 
             logger.debug(f"Scraping URL for {event_id}: {event_url}")
 
@@ -398,12 +473,15 @@ class PriceMonitor:
                 target_sections = self.section_preferences[event_id]
                 logger.info(f"Using section-based scraping for {event_id}, sections: {target_sections}")
 
-                # Initialize section scraper if needed
-                if not self.section_scraper:
-                    self.section_scraper = SectionBasedScraper(headless=True, timeout=30)
+                # Use the parallel scrape from check_all_prices unless it failed
+                result = self._prefetched_scrapes.pop(event_id, None)
+                if not result or not result['success']:
+                    # Initialize section scraper if needed
+                    if not self.section_scraper:
+                        self.section_scraper = SectionBasedScraper.get_shared(headless=True)
 
-                # Scrape prices for the specified sections
-                result = self.section_scraper.scrape_section_prices(event_url, sections=target_sections)
+                    # Scrape prices for the specified sections
+                    result = self.section_scraper.scrape_section_prices(event_url, sections=target_sections)
 
                 if result['success'] and result['sections']:
                     # Collect prices for all sections
@@ -428,7 +506,7 @@ class PriceMonitor:
 
             # Initialize optimized scraper if needed
             if not self.scraper:
-                self.scraper = TicketmasterOptimizedScraper(headless=True, timeout=30)
+                self.scraper = TicketmasterOptimizedScraper.get_shared(headless=True, timeout=30)
 
             # Get user-configured target sections for this event (legacy config check)
             from .config_manager import ConfigManager
@@ -7,15 +7,27 @@ stays within provider limits and implements proper backoff strategies.
 
 import sqlite3
 import logging
+import os
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Set
 from pathlib import Path
 
-from .database import get_connection, get_db_transaction
+from .database import get_connection, get_db_transaction, get_database_path
 
 logger = logging.getLogger(__name__)
 
+# Database paths whose rate_limits table has already been set up in this process
+_INITED: Set[str] = set()
+_INIT_LOCK = threading.Lock()
+
+# Number of recorded requests between automatic cleanups of expired records
+CLEANUP_INTERVAL = 500
+
+# INSERT ... RETURNING needs SQLite 3.35+; older libraries count in a second query
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
 
 class RateLimiter:
     """
@@ -23,6 +35,17 @@ class RateLimiter:
     
     Tracks API usage over time windows and prevents exceeding rate limits.
     Uses SQLite database for persistence across application restarts.
+    Request times are stored as INTEGER epoch seconds and bound as plain
+    ints, so no datetime adapter or converter runs on insert or read.
+    
+    The usage count returned by the last insert is kept in memory so limit
+    checks far below the limit need no COUNT query. Once that count reaches
+    half the limit, every check queries the database again.
+    
+    Other processes sharing the database do not refresh this process's
+    count. While it is below half the limit, it can be stale by their
+    requests, so each process may let through one request beyond the limit
+    before its own insert returns the true usage.
     """
     
     def __init__(self, max_requests: int, time_window: int, 
@@ -40,6 +63,8 @@ class RateLimiter:
         self.time_window = time_window
         self.db_path = db_path
         self.service_name = service_name
+        self._cached_usage: Optional[int] = None
+        self._requests_since_cleanup = 0
         
         # Initialize database table
         self._init_rate_limit_table()
@@ -47,26 +72,49 @@ class RateLimiter:
         logger.debug(f"Rate limiter initialized: {max_requests} requests per {time_window}s")
     
     def _init_rate_limit_table(self) -> None:
-        """Initialize the rate limiting table in the database."""
-        try:
-            with get_db_transaction(self.db_path) as conn:
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS rate_limits (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        service_name TEXT NOT NULL,
-                        request_time TIMESTAMP NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Create index for efficient queries
-                conn.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_rate_limits_service_time 
-                    ON rate_limits (service_name, request_time)
-                """)
-                
-        except Exception as e:
-            logger.error(f"Failed to initialize rate limit table: {e}")
+        """
+        Initialize the rate limiting table in the database.
+        
+        Runs once per database path per process, so constructing further
+        limiters for other services does not open another write transaction.
+        """
+        db_key = os.path.abspath(self.db_path or get_database_path())
+        
+        with _INIT_LOCK:
+            if db_key in _INITED:
+                return
+            
+            try:
+                self._create_rate_limit_table()
+                _INITED.add(db_key)
+            except Exception as e:
+                logger.error(f"Failed to initialize rate limit table: {e}")
+    
+    def _create_rate_limit_table(self) -> None:
+        """Create the rate limiting table and index, converting legacy rows."""
+        with get_db_transaction(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS rate_limits (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    service_name TEXT NOT NULL,
+                    request_time INTEGER NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # Create index for efficient queries
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_rate_limits_service_time 
+                ON rate_limits (service_name, request_time)
+            """)
+            
+            # Convert rows written before request times were stored as
+            # epoch seconds, so they compare correctly with int cutoffs
+            conn.execute("""
+                UPDATE rate_limits
+                SET request_time = CAST(strftime('%s', request_time, 'utc') AS INTEGER)
+                WHERE typeof(request_time) = 'text'
+            """)
     
     def can_make_request(self) -> bool:
         """
@@ -75,7 +123,12 @@ class RateLimiter:
         Returns:
             True if request can be made, False otherwise
         """
+        # Common case: plenty of budget left, no bookkeeping needed
+        if self._cached_usage is not None and self._cached_usage < self.max_requests >> 1:
+            return True
+        
         try:
+            # Near the limit, other processes' requests matter; count them all
             current_usage = self.get_current_usage()
             can_proceed = current_usage < self.max_requests
             
@@ -88,17 +141,48 @@ class RateLimiter:
             return True
     
     def record_request(self) -> None:
-        """Record that a request was made."""
+        """
+        Record that a request was made.
+        
+        The insert returns the updated usage for the time window, which
+        refreshes the in-memory usage count used by can_make_request. On
+        SQLite older than 3.35, which has no RETURNING, the count is read
+        by a second query in the same transaction.
+        """
         try:
+            now = int(time.time())
+            cutoff = now - self.time_window
+            
             with get_db_transaction(self.db_path) as conn:
-                conn.execute("""
-                    INSERT INTO rate_limits (service_name, request_time)
-                    VALUES (?, ?)
-                """, (self.service_name, datetime.now()))
+                if _SQLITE_HAS_RETURNING:
+                    result = conn.execute("""
+                        INSERT INTO rate_limits (service_name, request_time)
+                        VALUES (?, ?)
+                        RETURNING (
+                            SELECT COUNT(*) FROM rate_limits
+                            WHERE service_name = ? AND request_time >= ?
+                        ) AS usage
+                    """, (self.service_name, now, self.service_name, cutoff)).fetchone()
+                else:
+                    conn.execute("""
+                        INSERT INTO rate_limits (service_name, request_time)
+                        VALUES (?, ?)
+                    """, (self.service_name, now))
+                    result = conn.execute("""
+                        SELECT COUNT(*) AS usage FROM rate_limits
+                        WHERE service_name = ? AND request_time >= ?
+                    """, (self.service_name, cutoff)).fetchone()
                 
+            self._cached_usage = result['usage'] if result else None
             logger.debug(f"Recorded API request for {self.service_name}")
             
+            self._requests_since_cleanup += 1
+            if self._requests_since_cleanup >= CLEANUP_INTERVAL:
+                self._requests_since_cleanup = 0
+                self.cleanup_old_records()
+            
         except Exception as e:
+            self._cached_usage = None
             logger.error(f"Failed to record API request: {e}")
     
     def get_current_usage(self) -> int:
@@ -109,15 +193,16 @@ class RateLimiter:
             Number of requests made in the current time window
         """
         try:
-            cutoff_time = datetime.now() - timedelta(seconds=self.time_window)
+            cutoff = int(time.time()) - self.time_window
             
             with get_connection(self.db_path) as conn:
                 result = conn.execute("""
                     SELECT COUNT(*) FROM rate_limits 
                     WHERE service_name = ? AND request_time >= ?
-                """, (self.service_name, cutoff_time.isoformat())).fetchone()
+                """, (self.service_name, cutoff)).fetchone()
                 
-                return result[0] if result else 0
+                self._cached_usage = result[0] if result else 0
+                return self._cached_usage
                 
         except Exception as e:
             logger.error(f"Failed to get current usage: {e}")
@@ -141,17 +226,16 @@ class RateLimiter:
             DateTime when the oldest request in current window expires
         """
         try:
-            cutoff_time = datetime.now() - timedelta(seconds=self.time_window)
+            cutoff = int(time.time()) - self.time_window
             
             with get_connection(self.db_path) as conn:
                 result = conn.execute("""
                     SELECT MIN(request_time) FROM rate_limits 
                     WHERE service_name = ? AND request_time >= ?
-                """, (self.service_name, cutoff_time.isoformat())).fetchone()
+                """, (self.service_name, cutoff)).fetchone()
                 
                 if result and result[0]:
-                    oldest_request = datetime.fromisoformat(result[0])
-                    return oldest_request + timedelta(seconds=self.time_window)
+                    return datetime.fromtimestamp(result[0] + self.time_window)
                 else:
                     # No requests in window, reset time is now
                     return datetime.now()
@@ -195,13 +279,13 @@ class RateLimiter:
             Number of records cleaned up
         """
         try:
-            cutoff_time = datetime.now() - timedelta(seconds=self.time_window * 2)  # Keep some extra
+            cutoff = int(time.time()) - self.time_window * 2  # Keep some extra
             
             with get_db_transaction(self.db_path) as conn:
                 cursor = conn.execute("""
                     DELETE FROM rate_limits 
                     WHERE service_name = ? AND request_time < ?
-                """, (self.service_name, cutoff_time.isoformat()))
+                """, (self.service_name, cutoff))
                 
                 deleted_count = cursor.rowcount
                 
@@ -227,13 +311,13 @@ class RateLimiter:
             reset_time = self.get_reset_time()
             
             # Get request history for the last hour
-            hour_ago = datetime.now() - timedelta(hours=1)
+            hour_ago = int(time.time()) - 3600
             
             with get_connection(self.db_path) as conn:
                 hourly_usage = conn.execute("""
                     SELECT COUNT(*) FROM rate_limits 
                     WHERE service_name = ? AND request_time >= ?
-                """, (self.service_name, hour_ago.isoformat())).fetchone()[0]
+                """, (self.service_name, hour_ago)).fetchone()[0]
             
             return {
                 'service_name': self.service_name,
@@ -264,6 +348,7 @@ class RateLimiter:
                 
                 deleted_count = cursor.rowcount
                 
+            self._cached_usage = None
             logger.warning(f"Rate limiter reset: cleared {deleted_count} records for {self.service_name}")
             
         except Exception as e:
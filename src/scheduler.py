@@ -10,7 +10,7 @@ This module provides scheduling functionality for:
 import logging
 import time
 from datetime import datetime, time as dt_time
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, Union
 from threading import Thread, Event
 
 from .price_monitor import PriceMonitor
@@ -19,6 +19,11 @@ from .git_backup import GitDatabaseBackup
 logger = logging.getLogger(__name__)
 
 
+def _seconds_since_midnight(t: Union[dt_time, datetime]) -> int:
+    """Convert a time of day (or a datetime's clock time) to whole seconds since midnight."""
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
 class MonitoringScheduler:
     """
     Scheduler for automated price monitoring tasks.
@@ -43,6 +48,8 @@ class MonitoringScheduler:
         self.daily_summary_time = dt_time(9, 0)  # 9:00 AM
         self.cleanup_interval_days = 7  # Run cleanup weekly
         self.backup_time = dt_time(0, 0)  # Midnight for database backup
+        self._summary_sod = _seconds_since_midnight(self.daily_summary_time)
+        self._backup_sod = _seconds_since_midnight(self.backup_time)
 
         self._last_price_check = None
         self._last_summary_date = None
@@ -52,11 +59,9 @@ class MonitoringScheduler:
         # Initialize git backup system
         self.git_backup = GitDatabaseBackup()
 
-        # Try to restore database on startup (for Codespaces)
-        try:
-            self.git_backup.restore_database_from_git()
-        except Exception as e:
-            logger.warning(f"Database restore attempt failed: {e}")
+        # Restore database from git (for Codespaces) before the first task
+        # runs, rather than blocking the caller on git here
+        self._needs_restore = True
         
         logger.info("Monitoring scheduler initialized")
     
@@ -76,6 +81,8 @@ class MonitoringScheduler:
         self.daily_summary_time = daily_summary_time
         self.cleanup_interval_days = cleanup_interval_days
         self.backup_time = backup_time
+        self._summary_sod = _seconds_since_midnight(daily_summary_time)
+        self._backup_sod = _seconds_since_midnight(backup_time)
 
         logger.info(f"Scheduler configured: price checks every {price_check_interval}h, "
                    f"daily summary at {daily_summary_time}, "
@@ -116,6 +123,8 @@ class MonitoringScheduler:
         """Main scheduler loop."""
         logger.info("Scheduler loop started")
         
+        self._restore_database_if_needed()
+        
         while not self.stop_event.wait(timeout=60):  # Check every minute
             try:
                 current_time = datetime.now()
@@ -141,6 +150,23 @@ class MonitoringScheduler:
         
         logger.info("Scheduler loop stopped")
     
+    def _restore_database_if_needed(self) -> None:
+        """Restore a missing or empty database from git once, before any task uses it."""
+        if not self._needs_restore:
+            return
+
+        # A database that is already populated never needs the git round trip
+        db_path = self.git_backup.db_path
+        if db_path.exists() and db_path.stat().st_size > 0:
+            logger.debug("Database present, skipping restore")
+        else:
+            try:
+                self.git_backup.restore_database_from_git()
+            except Exception as e:
+                logger.warning(f"Database restore attempt failed: {e}")
+
+        self._needs_restore = False
+    
     def _should_check_prices(self, current_time: datetime) -> bool:
         """Determine if price check should run."""
         if not self._last_price_check:
@@ -152,11 +178,11 @@ class MonitoringScheduler:
     def _should_send_summary(self, current_time: datetime) -> bool:
         """Determine if daily summary should be sent."""
         current_date = current_time.date()
-        current_time_only = current_time.time()
+        current_sod = _seconds_since_midnight(current_time)
         
         # Check if we haven't sent today and it's time
         if (self._last_summary_date != current_date and 
-            current_time_only >= self.daily_summary_time):
+            current_sod >= self._summary_sod):
             return True
         
         return False
@@ -164,11 +190,11 @@ class MonitoringScheduler:
     def _should_backup_database(self, current_time: datetime) -> bool:
         """Determine if database backup should run."""
         current_date = current_time.date()
-        current_time_only = current_time.time()
+        current_sod = _seconds_since_midnight(current_time)
 
         # Check if we haven't backed up today and it's time
         if (self._last_backup_date != current_date and
-                current_time_only >= self.backup_time):
+                current_sod >= self._backup_sod):
             return True
 
         return False
@@ -255,6 +281,8 @@ class MonitoringScheduler:
             'timestamp': datetime.now()
         }
         
+        self._restore_database_if_needed()
+        
         try:
             # Run price check
             results['price_check'] = self.price_monitor.check_all_prices()
@@ -5,57 +5,781 @@ Uses Selenium WebDriver to hover over specific sections and extract
 pricing information from popups.
 """
 
+import atexit
+import contextlib
+import copy
+import functools
+import json
 import logging
+import math
 import os
+import queue
 import time
-import random
 import re
-from typing import Optional, List, Dict, Any
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Union
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import (
     TimeoutException, WebDriverException, NoSuchElementException,
     ElementNotInteractableException, StaleElementReferenceException,
     ElementClickInterceptedException
 )
 from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.driver_cache import DriverCacheManager
 
 logger = logging.getLogger(__name__)
 
+# Single-pass price pattern: "$99.99" (also covers "from $99.99+", "Price: $99.99")
+# or "99.99 USD" / "99.99 dollars"
+_PRICE_RE = re.compile(
+    r'\$(?P<dollars>[0-9]+(?:\.[0-9]{2})?)|(?P<amount>[0-9]+(?:\.[0-9]{2})?)\s*(?:USD|dollars?)',
+    re.IGNORECASE
+)
+
+# Characters that cannot appear literally in a CSS string and need a hex escape
+_CSS_CONTROL_RE = re.compile(r'[\x00-\x1f\x7f]')
+
+# Shared prelude for the section lookup scripts. Builds window.__secMap (lowercased
+# data-section-name -> element) once per page and reuses it until the map re-renders.
+# findSection() prefers an exact name over a case-insensitive partial match.
+_SECTION_MAP_JS = """
+const buildSectionMap = () => {
+    const map = new Map();
+    for (const e of document.querySelectorAll('[data-section-name]')) {
+        const key = e.getAttribute('data-section-name').toLowerCase();
+        if (!map.has(key)) {
+            map.set(key, e);
+        }
+    }
+    window.__secMap = map;
+    return map;
+};
+let sectionMap = window.__secMap;
+if (!sectionMap || sectionMap.size === 0 || ![...sectionMap.values()].every(e => e.isConnected)) {
+    sectionMap = buildSectionMap();
+}
+const findSection = target => {
+    const lower = target.toLowerCase();
+    if (sectionMap.has(lower)) {
+        return sectionMap.get(lower);
+    }
+    for (const [name, e] of sectionMap) {
+        if (name.includes(lower)) {
+            return e;
+        }
+    }
+    return null;
+};
+"""
+
+# Resolves every requested section to its map element in a single WebDriver call.
+_FIND_SECTIONS_JS = _SECTION_MAP_JS + """
+const found = {};
+for (const target of arguments[0]) {
+    const match = findSection(target);
+    if (match) {
+        found[target] = match;
+    }
+}
+return found;
+"""
+
+# Price tooltip shown while a map section is hovered
+_TOOLTIP_SELECTOR = '[data-bdd="hover-tool-tip-container"]'
+
+# Consent and promo dialogs shown over the page on load, and their accept buttons
+_MODAL_SELECTOR = ', '.join([
+    '[data-bdd*="modal"]',
+    '[data-bdd*="popup"]',
+    '[data-bdd*="consent"]'
+])
+_MODAL_ACCEPT_SELECTOR = ', '.join([
+    'button[data-analytics="accept-modal-accept-button"]',
+    'button[data-testid*="agree"]'
+])
+
+# Shared prelude: isUnavailable() is true for sections that will never show a
+# price tooltip - marked sold out or disabled, or not accepting pointer events
+_UNAVAILABLE_JS = """
+const isUnavailable = el => {
+    const availability = (el.getAttribute('data-availability') || '').toLowerCase();
+    // Whole class tokens only, so names like "seat-sold-count" do not match
+    const classes = (el.getAttribute('class') || '').toLowerCase().split(/\\s+/);
+    return ['unavailable', 'sold-out', 'soldout', 'false'].includes(availability)
+        || el.getAttribute('aria-disabled') === 'true'
+        || classes.some(name => ['unavailable', 'disabled', 'sold-out', 'soldout'].includes(name))
+        || getComputedStyle(el).pointerEvents === 'none';
+};
+"""
+
+# Shared prelude: tooltipText() reads the price tooltip if it is shown, and
+# nextFrame() waits for the next rendered frame
+_TOOLTIP_JS = """
+const nextFrame = () => new Promise(resolve => requestAnimationFrame(resolve));
+const tooltipText = selector => {
+    const el = document.querySelector(selector);
+    if (!el) {
+        return null;
+    }
+    const rect = el.getBoundingClientRect();
+    const text = el.innerText.trim();
+    return rect.width > 0 && rect.height > 0 && text ? text : null;
+};
+"""
+
+# Shared prelude: hoverAndRead() fires the pointer and mouse events that open a
+# section's price tooltip, at the section's centre, waits a frame at a time for
+# it and closes it again. Resolves to the tooltip text, null if none appeared,
+# or false if the section is unavailable.
+_HOVER_AND_READ_JS = _UNAVAILABLE_JS + _TOOLTIP_JS + """
+const fire = (el, types) => {
+    const box = el.getBoundingClientRect();
+    const position = {clientX: (box.left + box.right) / 2, clientY: (box.top + box.bottom) / 2};
+    for (const type of types) {
+        // enter and leave events do not bubble in a real browser either
+        const init = {...position, bubbles: !/enter|leave/.test(type), cancelable: true, view: window};
+        el.dispatchEvent(type.startsWith('pointer')
+            ? new PointerEvent(type, {...init, pointerId: 1, pointerType: 'mouse', isPrimary: true})
+            : new MouseEvent(type, init));
+    }
+};
+async function hoverAndRead(el, selector, maxWait) {
+    if (isUnavailable(el)) {
+        return false;
+    }
+    // A tooltip left over from the previous section must not be read again
+    const stale = tooltipText(selector);
+    // Scrolling forces layout, so leave sections that are already on screen alone
+    const box = el.getBoundingClientRect();
+    if (box.top < 0 || box.left < 0 || box.bottom > innerHeight || box.right > innerWidth) {
+        el.scrollIntoView({block: 'center'});
+    }
+    fire(el, ['pointerover', 'pointerenter', 'mouseover', 'mouseenter', 'pointermove', 'mousemove']);
+    const deadline = performance.now() + maxWait * 1000;
+    let text = tooltipText(selector);
+    while ((!text || text === stale) && performance.now() < deadline && !isUnavailable(el)) {
+        await nextFrame();
+        text = tooltipText(selector);
+    }
+    fire(el, ['pointerout', 'pointerleave', 'mouseout', 'mouseleave']);
+    const hideBy = performance.now() + 500;
+    while (tooltipText(selector) && performance.now() < hideBy) {
+        await nextFrame();
+    }
+    return text && text !== stale ? text : null;
+}
+"""
+
+# Scrolls a section into view and returns its centre in viewport coordinates,
+# where a trusted mouse event has to be sent
+_SECTION_CENTER_JS = """
+const el = arguments[0];
+el.scrollIntoView({block: 'center'});
+const box = el.getBoundingClientRect();
+return {x: (box.left + box.right) / 2, y: (box.top + box.bottom) / 2};
+"""
+
+# Waits for the price tooltip after a real (trusted) mouse hover and returns its
+# text, or null if none appeared in time
+_READ_TOOLTIP_JS = _TOOLTIP_JS + """
+const [selector, maxWait] = arguments;
+const done = arguments[arguments.length - 1];
+async function readTooltip() {
+    const deadline = performance.now() + maxWait * 1000;
+    let text = tooltipText(selector);
+    while (!text && performance.now() < deadline) {
+        await nextFrame();
+        text = tooltipText(selector);
+    }
+    return text;
+}
+readTooltip().then(done, () => done(null));
+"""
+
+# Hovers one section element and returns its tooltip text, so the hover and the
+# read share a single WebDriver call
+_HOVER_SECTION_JS = _HOVER_AND_READ_JS + """
+const [section, selector, maxWait] = arguments;
+const done = arguments[arguments.length - 1];
+hoverAndRead(section, selector, maxWait).then(done, () => done(null));
+"""
+
+# Hovers every requested section in turn inside the page and collects each
+# tooltip's text, so a whole event costs one WebDriver call. Sections are
+# matched like _FIND_SECTIONS_JS; unavailable or unmatched ones are left out.
+_HOVER_ALL_SECTIONS_JS = _SECTION_MAP_JS + _HOVER_AND_READ_JS + """
+const [names, selector, maxWait] = arguments;
+const done = arguments[arguments.length - 1];
+async function hoverAll() {
+    const texts = {};
+    for (const target of names) {
+        const el = findSection(target);
+        if (!el) {
+            continue;
+        }
+        const text = await hoverAndRead(el, selector, maxWait);
+        if (text !== false) {
+            texts[target] = text;
+        }
+    }
+    return texts;
+}
+hoverAll().then(done, () => done(null));
+"""
+
+# True when Ticketmaster served its bot-detection block page; checked in-page
+# so the whole DOM is not serialised over the wire as page_source. Public
+# because the optimized scraper runs the same check.
+ACCESS_DENIED_JS = """
+return !!document.body && document.body.innerText.includes('Access to this page has been denied');
+"""
+
+# True if any element matching the selector is rendered. getClientRects() is
+# used instead of offsetParent because modals are usually position: fixed.
+_ANY_VISIBLE_JS = """
+return Array.from(document.querySelectorAll(arguments[0])).some(e => e.getClientRects().length > 0);
+"""
+
+# Adds <link rel="prefetch"> hints so the browser fetches upcoming pages while idle
+_PREFETCH_JS = """
+for (const url of arguments[0]) {
+    const link = document.createElement('link');
+    link.rel = 'prefetch';
+    link.href = url;
+    document.head.appendChild(link);
+}
+"""
+
+# Adds dns-prefetch and preconnect hints so the first navigation skips the handshakes
+_PRECONNECT_JS = """
+for (const origin of arguments[0]) {
+    for (const rel of ['dns-prefetch', 'preconnect']) {
+        const link = document.createElement('link');
+        link.rel = rel;
+        link.href = origin;
+        document.head.appendChild(link);
+    }
+}
+"""
+
+# Origins new drivers open connections to before the first event page
+PRECONNECT_ORIGINS = ["https://www.ticketmaster.com"]
+
+# Recent scrape results keyed by (event_url, sections), stored as (scraped_at, result)
+_RESULT_CACHE: Dict[Tuple[str, Tuple[str, ...]], Tuple[float, Dict[str, Any]]] = {}
+
+# Most results kept in _RESULT_CACHE before the oldest are evicted
+RESULT_CACHE_MAXSIZE = 1024
+_RESULT_CACHE_LOCK = threading.Lock()
+
+# Seconds between WebDriverWait condition checks; each check is a round trip
+# to chromedriver, so going much lower mostly adds overhead
+WAIT_POLL_FREQUENCY = 0.1
+
+# ISMDS responses carrying the seat map's pricing facets, captured from the
+# performance log for sections whose tooltip could not be read
+_PRICING_URL_RE = re.compile(r'/api/ismds/|quickpicks|facets|offeradapter', re.IGNORECASE)
+
+
+# Days webdriver-manager reuses a downloaded ChromeDriver without checking for updates
+WDM_CACHE_VALID_DAYS = 7
+
+# Bytes of HTTP disk cache each Chrome profile may use
+DISK_CACHE_SIZE = 100 * 1024 * 1024
+
+# HTTP connections each driver may keep open to chromedriver
+DRIVER_HTTP_POOL_SIZE = 16
+
+# Images, fonts, video and trackers; the seat map SVG and stylesheets are
+# left alone because tooltip visibility depends on layout
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*", "*facebook.net*", "*branch.io*",
+]
+
+
 class SectionScrapingError(Exception):
     """Exception raised for section scraping errors."""
     pass
 
 
+class _DriverPool:
+    """
+    Process-wide pool of idle Chrome WebDrivers.
+
+    Scrapers borrow a warm driver when they are created and hand it back when
+    closed, so a new scraper does not pay Chrome and ChromeDriver startup again.
+    """
+
+    def __init__(self, max_idle: int = 2):
+        """
+        Initialize the pool.
+
+        Args:
+            max_idle: Maximum number of idle drivers kept alive
+        """
+        self._idle: "queue.Queue" = queue.Queue(maxsize=max_idle)
+
+    def acquire(self):
+        """
+        Take an idle driver from the pool.
+
+        Returns:
+            A live WebDriver, or None if no idle driver is available
+        """
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+
+            try:
+                driver.current_url  # Cheap liveness check
+                return driver
+            except Exception:
+                logger.debug("Discarding dead pooled WebDriver")
+                _quit_driver(driver)
+
+    def release(self, driver) -> bool:
+        """
+        Return a driver to the pool.
+
+        Args:
+            driver: WebDriver to keep for reuse
+
+        Returns:
+            True if pooled, False if the pool is full and the caller should quit it
+        """
+        try:
+            self._idle.put_nowait(driver)
+            return True
+        except queue.Full:
+            return False
+
+    def shutdown(self) -> None:
+        """Quit all idle drivers."""
+        while True:
+            try:
+                _quit_driver(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+# Idle driver pools, one per headless setting
+_DRIVER_POOLS: Dict[bool, _DriverPool] = {True: _DriverPool(), False: _DriverPool()}
+
+# Long-lived scrapers handed out by get_shared_scraper, keyed by (scraper class, headless, timeout)
+_SHARED_SCRAPERS: Dict[Tuple[type, bool, int], Any] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def _quit_driver(driver, max_wait: float = 2.0) -> None:
+    """
+    Quit a WebDriver and wait until its chromedriver process has exited.
+
+    Args:
+        driver: WebDriver to quit
+        max_wait: Longest time to wait for the process to exit
+    """
+    try:
+        service = getattr(driver, 'service', None)
+        process = getattr(service, 'process', None)
+        driver.quit()
+
+        # Wait for actual process exit instead of sleeping a fixed interval
+        if process is not None:
+            try:
+                process.wait(timeout=max_wait)
+            except subprocess.TimeoutExpired:
+                logger.warning("ChromeDriver did not exit after quit, killing it")
+                process.kill()
+    except Exception as e:
+        logger.error(f"Error closing WebDriver: {e}")
+
+
+@contextlib.contextmanager
+def _timed(phase: str) -> Iterator[None]:
+    """
+    Log how long the enclosed block took, at debug level.
+
+    Args:
+        phase: Name of the scrape phase being timed
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        logger.debug(f"{phase} took {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+def _xpath_literal(value: str) -> str:
+    """
+    Quote a string for use as an XPath 1.0 literal.
+
+    Args:
+        value: Raw string, which may contain either kind of quote
+
+    Returns:
+        XPath expression evaluating to the string
+    """
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+def _section_xpath(section_name: str) -> str:
+    """
+    Build the XPath that finds a section by its text content.
+
+    Args:
+        section_name: Section name to look for
+
+    Returns:
+        XPath selecting the first element whose text contains the name
+    """
+    return f"(//*[contains(text(), {_xpath_literal(section_name)})])[1]"
+
+
+def _css_string(value: str) -> str:
+    """
+    Quote a string for use inside a CSS attribute selector.
+
+    Args:
+        value: Raw string
+
+    Returns:
+        Double-quoted CSS string with quotes, backslashes and control
+        characters escaped
+    """
+    escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+    escaped = _CSS_CONTROL_RE.sub(lambda m: f"\\{ord(m.group()):x} ", escaped)
+    return f'"{escaped}"'
+
+
+def _normalize_section_name(name: str) -> str:
+    """
+    Normalize a section name for comparison.
+
+    Args:
+        name: Section name as shown on the map or in a response
+
+    Returns:
+        Lowercased name with runs of whitespace collapsed
+    """
+    return ' '.join(name.split()).lower()
+
+
+def _section_prices_from_json(payloads: List[Any], sections: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Pull the lowest price for each requested section out of ISMDS facets responses.
+
+    Only the facets schema is read: a top-level "facets" list whose entries
+    name a "section" and carry a "listPriceRange" list of {"min": ...}
+    ranges. A section is only priced when its name matches a facet's section
+    exactly (ignoring case and spacing), so "101" never takes the price of
+    "1012".
+
+    Args:
+        payloads: Decoded JSON response bodies
+        sections: Section names to look for
+
+    Returns:
+        Dictionary mapping requested section names to price dictionaries in
+        the same format as popup extraction
+    """
+    lowest: Dict[str, float] = {}
+    for payload in payloads:
+        facets = payload.get('facets') if isinstance(payload, dict) else None
+        if not isinstance(facets, list):
+            continue
+
+        for facet in facets:
+            if not isinstance(facet, dict) or facet.get('available') is False:
+                continue
+            name = facet.get('section')
+            ranges = facet.get('listPriceRange')
+            if not isinstance(name, str) or not isinstance(ranges, list):
+                continue
+
+            for price_range in ranges:
+                price = price_range.get('min') if isinstance(price_range, dict) else None
+                if isinstance(price, (int, float)) and not isinstance(price, bool) and price > 0:
+                    key = _normalize_section_name(name)
+                    lowest[key] = min(price, lowest.get(key, price))
+
+    found = {}
+    for section_name in sections:
+        price = lowest.get(_normalize_section_name(section_name))
+        if price is not None:
+            found[section_name] = {
+                'price': float(price),
+                'text': f"${price:.2f}",
+                'currency': 'USD',
+                'section': section_name
+            }
+    return found
+
+
+def _cache_result(cache_key: Tuple[str, Tuple[str, ...]], result: Dict[str, Any], ttl: float) -> None:
+    """
+    Store a scrape result, keeping the cache within RESULT_CACHE_MAXSIZE.
+
+    Expired entries are dropped first; if the cache is still full the oldest
+    entries go, since dicts keep insertion order.
+
+    Args:
+        cache_key: (event_url, sorted section names)
+        result: Scrape result to store (copied)
+        ttl: Seconds results stay fresh
+    """
+    entry = (result['scraped_at'], copy.deepcopy(result))
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE.pop(cache_key, None)
+        if len(_RESULT_CACHE) >= RESULT_CACHE_MAXSIZE:
+            cutoff = time.time() - ttl
+            for key in [k for k, (scraped_at, _) in _RESULT_CACHE.items() if scraped_at < cutoff]:
+                del _RESULT_CACHE[key]
+            while len(_RESULT_CACHE) >= RESULT_CACHE_MAXSIZE:
+                del _RESULT_CACHE[next(iter(_RESULT_CACHE))]
+
+        _RESULT_CACHE[cache_key] = entry
+
+
+def _widen_connection_pool(driver, maxsize: int = DRIVER_HTTP_POOL_SIZE) -> None:
+    """
+    Let a driver's HTTP client keep several connections to chromedriver.
+
+    Selenium's urllib3 pool holds one connection by default, so commands
+    issued from more than one thread queue behind it. webdriver.Chrome does
+    not accept a ClientConfig, so the pool is rebuilt on the executor it made.
+
+    Args:
+        driver: WebDriver instance
+        maxsize: Connections to keep per host
+    """
+    try:
+        executor = driver.command_executor
+        executor._client_config.init_args_for_pool_manager = {
+            "init_args_for_pool_manager": {"maxsize": maxsize}
+        }
+        if getattr(executor, '_conn', None) is not None:
+            executor._conn.clear()
+            executor._conn = executor._get_connection_manager()
+    except Exception as e:
+        logger.debug(f"Could not resize WebDriver connection pool: {e}")
+
+
+def _block_unused_resources(driver) -> None:
+    """
+    Stop the browser fetching resources the scraper never reads.
+
+    Args:
+        driver: WebDriver instance
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        # Keep the HTTP cache on so scripts and styles carry over between events
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+    except Exception as e:
+        logger.debug(f"Could not block unused resources: {e}")
+
+
+@functools.lru_cache(maxsize=1)
+def resolve_chromedriver_path() -> str:
+    """
+    Locate ChromeDriver, resolving it only once per process.
+
+    Checks CHROMEDRIVER_PATH, then the usual system locations, and only then
+    falls back to webdriver-manager, whose install() checks for driver
+    updates over the network.
+
+    Returns:
+        Path to the ChromeDriver executable
+    """
+    # Force explicit ChromeDriver path to avoid Selenium auto-detection issues in containers
+    import shutil
+    system_chromedriver = shutil.which('chromedriver')
+
+    explicit_chromedriver_paths = [
+        os.environ.get('CHROMEDRIVER_PATH'),
+        '/usr/local/bin/chromedriver',
+        '/usr/bin/chromedriver',
+        system_chromedriver
+    ]
+
+    for path in explicit_chromedriver_paths:
+        if path and os.path.exists(path) and os.access(path, os.X_OK):
+            logger.debug(f"Using ChromeDriver: {path}")
+            return path
+
+    # Trust a downloaded driver for a week before checking for a newer one
+    cache_manager = DriverCacheManager(valid_range=WDM_CACHE_VALID_DAYS)
+    chromedriver_path = ChromeDriverManager(cache_manager=cache_manager).install()
+    logger.debug(f"ChromeDriver installed: {chromedriver_path}")
+    return chromedriver_path
+
+
+def _merge_scrape_results(event_url: str,
+                          parts: List[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Combine the results of scraping chunks of one event's sections.
+
+    Args:
+        event_url: Full URL to the Ticketmaster event page
+        parts: scrape_section_prices results, None for chunks no browser session ran
+
+    Returns:
+        Dictionary with pricing information by section, in the same
+        format as SectionBasedScraper.scrape_section_prices
+    """
+    if len(parts) == 1 and parts[0] is not None:
+        return parts[0]
+
+    result = {
+        'url': event_url,
+        'sections': {},
+        'scraped_at': min((part['scraped_at'] for part in parts if part), default=time.time()),
+        'success': False,
+        'error': None
+    }
+    for part in parts:
+        if part is None:
+            # Left unscraped by workers that could not start a browser
+            result['error'] = "No browser session available"
+        else:
+            result['sections'].update(part['sections'])
+            result['error'] = result['error'] or part['error']
+
+    if result['sections']:
+        result['success'] = True
+    elif not result['error']:
+        result['error'] = "No section prices found"
+
+    return result
+
+
+def get_shared_scraper(scraper_cls: type, headless: bool, timeout: int, **kwargs) -> Any:
+    """
+    Return the process-wide scraper of a class for these settings, creating it on first use.
+
+    The shared scraper keeps its browser between calls, so scraping many events
+    pays Chrome's start-up cost once. It is not thread-safe; use separate
+    instances for concurrent scraping. A shared scraper closed by a caller gets
+    a fresh browser on its next use, and all of them are closed at exit.
+
+    Args:
+        scraper_cls: Scraper class; instances need a driver attribute and _setup_driver()
+        headless: Run browser in headless mode
+        timeout: Page load timeout in seconds
+        **kwargs: Further constructor arguments, used when the scraper is created
+
+    Returns:
+        Shared scraper instance
+    """
+    key = (scraper_cls, headless, timeout)
+    with _SHARED_LOCK:
+        scraper = _SHARED_SCRAPERS.get(key)
+        if scraper is None:
+            scraper = scraper_cls(headless=headless, timeout=timeout, **kwargs)
+            _SHARED_SCRAPERS[key] = scraper
+        elif scraper.driver is None:
+            # Closed by a caller; start a fresh session on the same instance
+            scraper._setup_driver()
+        return scraper
+
+
+def shutdown_driver_pools() -> None:
+    """Close shared scrapers and quit every pooled WebDriver in this process."""
+    with _SHARED_LOCK:
+        shared = list(_SHARED_SCRAPERS.values())
+        _SHARED_SCRAPERS.clear()
+    for scraper in shared:
+        scraper.close()
+
+    for pool in _DRIVER_POOLS.values():
+        pool.shutdown()
+
+
+atexit.register(shutdown_driver_pools)
+
+
 class SectionBasedScraper:
     """
     Web scraper that extracts ticket prices by hovering over specific sections.
 
     Uses Selenium WebDriver with Chrome to handle JavaScript interactions
     and extract pricing from hover popups.
+
+    An instance keeps its browser session between calls, so one scraper can
+    be reused for any number of event URLs; see scrape_events.
     """
 
-    def __init__(self, headless: bool = False, timeout: int = 30):
+    def __init__(self, headless: bool = False, timeout: int = 20,
+                 reuse_driver: bool = True, cache_ttl: float = 60,
+                 profile_dir: Optional[str] = None, short_timeout: int = 8):
         """
         Initialize the scraper.
 
         Args:
             headless: Run browser in headless mode (False for hover interactions)
             timeout: Page load timeout in seconds
+            reuse_driver: Borrow a warm driver from the process-wide pool and
+                return it on close instead of quitting Chrome
+            cache_ttl: Seconds a scrape result is reused for the same URL and
+                sections (0 disables caching)
+            profile_dir: Persistent Chrome profile directory whose disk cache
+                carries over between runs. Chrome locks a profile while it is
+                open, so such drivers bypass the pool and are quit on close.
+            short_timeout: Seconds to wait for elements on an already loaded
+                page, such as the seat map
         """
         self.headless = headless
         self.timeout = timeout
+        self.short_timeout = short_timeout
+        self.profile_dir = profile_dir
+        self.reuse_driver = reuse_driver and not profile_dir
+        self.cache_ttl = cache_ttl
         self.driver = None
         self.wait = None
         self._setup_driver()
 
     def _setup_driver(self) -> None:
-        """Set up Chrome WebDriver with optimal settings for hover interactions."""
+        """Borrow a pooled WebDriver or start a new one, and apply timeouts."""
+        driver = _DRIVER_POOLS[self.headless].acquire() if self.reuse_driver else None
+
+        if driver:
+            logger.debug("Reusing pooled WebDriver")
+        else:
+            driver = self._create_driver()
+
+        self.driver = driver
+        self.driver.set_page_load_timeout(self.timeout)
+        # Lookups that miss must fail at once; all waiting goes through self.wait
+        self.driver.implicitly_wait(0)
+        self.wait = WebDriverWait(self.driver, self.short_timeout, poll_frequency=WAIT_POLL_FREQUENCY)
+
+    def _create_driver(self):
+        """
+        Start Chrome WebDriver with optimal settings for hover interactions.
+
+        Returns:
+            New Chrome WebDriver instance
+
+        Raises:
+            SectionScrapingError: If the driver cannot be started
+        """
         try:
             chrome_options = Options()
 
@@ -70,11 +794,22 @@ class SectionBasedScraper:
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
 
+            # Record network events so pricing responses can be read directly
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+            # Return from get() at DOMContentLoaded rather than the load event
+            chrome_options.page_load_strategy = "eager"
+
+            # Only the seat map DOM and tooltips are read, so skip image downloads
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2
+            })
+
             # Additional container/server options
             chrome_options.add_argument("--disable-background-timer-throttling")
             chrome_options.add_argument("--disable-backgrounding-occluded-windows")
             chrome_options.add_argument("--disable-renderer-backgrounding")
-            chrome_options.add_argument("--disable-features=TranslateUI")
             chrome_options.add_argument("--disable-ipc-flooding-protection")
 
             # Window size for proper rendering
@@ -87,33 +822,13 @@ class SectionBasedScraper:
             chrome_options.add_argument("--disable-gpu")
             chrome_options.add_argument("--disable-extensions")
             chrome_options.add_argument("--disable-plugins")
-            chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+            # Chrome only honours the last --disable-features switch, so list them all in one
+            chrome_options.add_argument(
+                "--disable-features=TranslateUI,Translate,VizDisplayCompositor,InterestFeedContentSuggestions"
+            )
 
-            # Force explicit ChromeDriver path to avoid Selenium auto-detection issues in containers
-            import shutil
-            system_chromedriver = shutil.which('chromedriver')
             try:
-                # First try the known system path
-                explicit_chromedriver_paths = [
-                    '/usr/local/bin/chromedriver',
-                    '/usr/bin/chromedriver',
-                    system_chromedriver
-                ]
-
-                chromedriver_path = None
-                for path in explicit_chromedriver_paths:
-                    if path and os.path.exists(path) and os.access(path, os.X_OK):
-                        chromedriver_path = path
-                        break
-
-                if chromedriver_path:
-                    service = Service(chromedriver_path)
-                    logger.debug(f"Using ChromeDriver: {chromedriver_path}")
-                else:
-                    chromedriver_path = ChromeDriverManager().install()
-                    service = Service(chromedriver_path)
-                    logger.debug(f"ChromeDriver installed: {chromedriver_path}")
-
+                service = Service(resolve_chromedriver_path())
             except Exception as e:
                 logger.error(f"ChromeDriver setup failed: {e}")
                 raise SectionScrapingError(f"ChromeDriver setup failed: {e}")
@@ -125,15 +840,30 @@ class SectionBasedScraper:
             # Additional options for ARM64 and container stability
             chrome_options.add_argument("--disable-software-rasterizer")
 
+            # Room for Ticketmaster's script bundles so repeat visits revalidate
+            # instead of downloading them again
+            chrome_options.add_argument(f"--disk-cache-size={DISK_CACHE_SIZE}")
+            if self.profile_dir:
+                os.makedirs(self.profile_dir, exist_ok=True)
+                chrome_options.add_argument(f"--user-data-dir={self.profile_dir}")
+
             try:
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                self.driver.set_page_load_timeout(self.timeout)
-                self.wait = WebDriverWait(self.driver, self.timeout)
+                driver = webdriver.Chrome(service=service, options=chrome_options)
+
+                _widen_connection_pool(driver)
+                _block_unused_resources(driver)
 
-                # Execute script to remove webdriver property
-                self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+                # Hide the webdriver property before any page script can read it
+                driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                    "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+                })
+
+                # Warm DNS, TCP and TLS while the caller is still preparing its request
+                driver.get("about:blank")
+                driver.execute_script(_PRECONNECT_JS, PRECONNECT_ORIGINS)
 
                 logger.info("WebDriver initialized successfully")
+                return driver
 
             except Exception as webdriver_error:
                 logger.error(f"WebDriver creation failed: {webdriver_error}")
@@ -143,7 +873,9 @@ class SectionBasedScraper:
             logger.error(f"Failed to initialize WebDriver: {e}")
             raise SectionScrapingError(f"WebDriver initialization failed: {e}")
 
-    def scrape_section_prices(self, event_url: str, sections: List[str] = None) -> Dict[str, Any]:
+    def scrape_section_prices(self, event_url: str, sections: List[str] = None,
+                              prefetch_urls: Optional[List[str]] = None,
+                              force_refresh: bool = False) -> Dict[str, Any]:
         """
         Scrape pricing information for specific sections from a Ticketmaster event page.
 
@@ -151,6 +883,9 @@ class SectionBasedScraper:
             event_url: Full URL to the Ticketmaster event page
             sections: List of section names to check (e.g., ["GENERAL ADMISSION - Standing Room Only"])
                      If None, defaults to general admission
+            prefetch_urls: Event URLs that will be scraped next; the browser
+                     prefetches them while this page's hovers run
+            force_refresh: Scrape the page even if a fresh cached result exists
 
         Returns:
             Dictionary with pricing information by section
@@ -161,6 +896,13 @@ class SectionBasedScraper:
         if sections is None:
             sections = ["GENERAL ADMISSION - Standing Room Only"]
 
+        # Section order does not change the result, so it does not split the cache
+        cache_key = (event_url, tuple(sorted(sections)))
+        cached = None if force_refresh else _RESULT_CACHE.get(cache_key)
+        if cached and time.time() - cached[0] < self.cache_ttl:
+            logger.info(f"Cache hit for {event_url}")
+            return copy.deepcopy(cached[1])
+
         logger.info(f"Scraping prices: {event_url}")
 
         if not self.driver:
@@ -175,43 +917,96 @@ class SectionBasedScraper:
         }
 
         try:
-            # Navigate to the page
-            self.driver.get(event_url)
-
-            # Wait for initial page load
-            time.sleep(random.uniform(3, 5))
+            # Navigate to the page; with the eager strategy this returns once
+            # the DOM is parsed, and a slow subresource tail is not fatal
+            self._clear_performance_log()
+            try:
+                with _timed("page_load"):
+                    self.driver.get(event_url)
+            except TimeoutException:
+                logger.debug(f"Page load timed out, continuing with partial page: {event_url}")
 
             # Check for bot detection
-            if "Access to this page has been denied" in self.driver.page_source:
+            if self.driver.execute_script(ACCESS_DENIED_JS):
                 raise SectionScrapingError("Access denied - bot detection")
 
             # Handle initial popup/consent dialog
-            self._handle_initial_popup()
+            with _timed("initial_popup"):
+                self._handle_initial_popup()
 
             # Wait for interactive map to load
             try:
-                self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-section-name]'))
-                )
+                with _timed("map_wait"):
+                    self.wait.until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, '[data-section-name]'))
+                    )
+                # Index the map's sections for the lookups that follow. The page
+                # is not stopped: tooltips and pricing facets still load over
+                # XHR, and images, media and trackers are already blocked.
+                self.driver.execute_script(_SECTION_MAP_JS)
             except TimeoutException:
+                # A block page rendered by a script challenge only shows up after
+                # DOMContentLoaded, so look again before hovering an empty page
+                if self.driver.execute_script(ACCESS_DENIED_JS):
+                    raise SectionScrapingError("Access denied - bot detection")
                 logger.debug("Interactive map not found")
 
+            if prefetch_urls:
+                self._prefetch_urls(prefetch_urls)
+
+            # Hover and read every section in one browser call, then retry
+            # the ones it could not price one at a time
+            section_prices = {}
+            with _timed("batch_hover"):
+                popup_texts = self._extract_all_sections_js(sections)
+            for section_name, popup_text in popup_texts.items():
+                price_data = self._extract_price_from_element(popup_text) if popup_text else None
+                if price_data:
+                    price_data['section'] = section_name
+                    section_prices[section_name] = price_data
+
+            remaining = [name for name in sections if name not in section_prices]
+            section_elements = self._find_section_elements(remaining) if remaining else {}
+
             # Process each section
             successful_sections = []
             failed_sections = []
 
             for section_name in sections:
-                section_data = self._extract_section_price(section_name)
+                section_data = section_prices.get(section_name)
+                if section_data is None:
+                    # The index already covers data-section-name, so only
+                    # the text fallback is left for sections it did not find.
+                    # Sections the batch already hovered without a popup only
+                    # get the real mouse hover.
+                    with _timed(f"section_hover {section_name}"):
+                        section_data = self._extract_section_price(
+                            section_name, section_elements.get(section_name), search_attributes=False,
+                            synthetic_hover=section_name not in popup_texts
+                        )
                 if section_data:
                     result['sections'][section_name] = section_data
                     successful_sections.append(section_name)
                 else:
                     failed_sections.append(section_name)
 
+            # Sections no hover could price fall back to the map's own pricing responses
+            if failed_sections:
+                with _timed("network_prices"):
+                    network_prices = _section_prices_from_json(
+                        self._capture_pricing_responses(event_url), failed_sections
+                    )
+                for section_name, section_data in network_prices.items():
+                    logger.info(f"Using network price for {section_name}: ${section_data['price']}")
+                    result['sections'][section_name] = section_data
+                    successful_sections.append(section_name)
+
             # Log summary
             if successful_sections:
                 result['success'] = True
                 logger.info(f"Scraped {len(successful_sections)}/{len(sections)} sections")
+                if self.cache_ttl > 0:
+                    _cache_result(cache_key, result, self.cache_ttl)
             else:
                 result['error'] = "No section prices found"
                 logger.warning(f"No section prices found for {len(sections)} sections")
@@ -236,6 +1031,105 @@ class SectionBasedScraper:
             result['error'] = error_msg
             return result
 
+    @classmethod
+    def get_shared(cls, headless: bool = True, timeout: int = 20) -> 'SectionBasedScraper':
+        """
+        Return the process-wide section scraper for these settings; see get_shared_scraper.
+
+        If TIXSCANNER_CHROME_PROFILE is set, the browser uses that persistent
+        profile so its HTTP and code caches survive restarts; otherwise each
+        run starts with a fresh profile.
+
+        Args:
+            headless: Run browser in headless mode
+            timeout: Page load timeout in seconds
+
+        Returns:
+            Shared SectionBasedScraper instance
+        """
+        return get_shared_scraper(cls, headless, timeout,
+                                  profile_dir=os.environ.get('TIXSCANNER_CHROME_PROFILE'))
+
+    @classmethod
+    def scrape_events(cls, urls_sections: List[Tuple[str, List[str]]], concurrency: int = 1,
+                      headless: bool = True, timeout: int = 20,
+                      section_shards: int = 1) -> Dict[str, Dict[str, Any]]:
+        """
+        Scrape several events on up to `concurrency` browser sessions at once.
+
+        Each worker thread runs its own scraper, borrowing a warm driver from the
+        process-wide pool and returning it when done, and pulls work from a
+        shared queue until it is empty. Threads spend nearly all their time
+        waiting on the browser, so they overlap page loads without extra
+        processes. While one page is hovered, the browser prefetches the event
+        its worker is likely to take next.
+
+        With section_shards above 1, each event's sections are split into that
+        many contiguous chunks, queued separately, so one event's sections are
+        hovered on several sessions in parallel and merged afterwards. With
+        concurrency 1, events are scraped one after another on a single session.
+
+        Args:
+            urls_sections: (event_url, sections) pairs to scrape
+            concurrency: Maximum number of browser sessions used at once
+            headless: Run browsers in headless mode
+            timeout: Page load timeout in seconds
+            section_shards: Chunks each event's sections are split into
+
+        Returns:
+            Dictionary mapping each event URL to its scrape_section_prices result
+        """
+        if not urls_sections:
+            return {}
+
+        # One task per chunk of an event's sections, in event order
+        tasks: List[Tuple[str, List[str]]] = []
+        for event_url, sections in urls_sections:
+            if not sections:
+                tasks.append((event_url, sections))
+                continue
+            chunk_size = math.ceil(len(sections) / max(1, min(section_shards, len(sections))))
+            tasks.extend((event_url, sections[i:i + chunk_size]) for i in range(0, len(sections), chunk_size))
+
+        concurrency = max(1, min(concurrency, len(tasks)))
+        task_results: Dict[int, Dict[str, Any]] = {}
+        pending: 'queue.Queue[int]' = queue.Queue()
+        for index in range(len(tasks)):
+            pending.put(index)
+
+        def worker() -> None:
+            with cls(headless=headless, timeout=timeout) as scraper:
+                while True:
+                    try:
+                        index = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    event_url, sections = tasks[index]
+                    # Workers take tasks in turn, so this one's next task is `concurrency` on
+                    next_urls = [url for url, _ in tasks[index + concurrency:index + concurrency + 1]
+                                 if url != event_url]
+                    task_results[index] = scraper.scrape_section_prices(
+                        event_url, sections=sections, prefetch_urls=next_urls
+                    )
+
+        logger.info(f"Scraping {len(urls_sections)} events in {len(tasks)} tasks "
+                    f"with {concurrency} browser sessions")
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(worker) for _ in range(concurrency)]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Event scraping worker failed: {e}")
+
+        parts_by_url: Dict[str, List[Optional[Dict[str, Any]]]] = {}
+        for index, (event_url, _) in enumerate(tasks):
+            parts_by_url.setdefault(event_url, []).append(task_results.get(index))
+
+        return {event_url: _merge_scrape_results(event_url, parts)
+                for event_url, parts in parts_by_url.items()}
+
     def _handle_initial_popup(self) -> None:
         """
         Handle the initial popup/consent dialog that requires clicking "Accept".
@@ -244,85 +1138,198 @@ class SectionBasedScraper:
         before any interactions can take place.
         """
         try:
-            # Expanded modal selectors to catch more popup types
-            modal_selectors = ', '.join([
-                '[data-bdd*="modal"]',
-                '[data-bdd*="popup"]',
-                '[data-bdd*="consent"]'
-            ])
-
-            # Wait up to 10 seconds for any modal/popup to appear
+            # Wait for a modal or the seat map, whichever renders first. Hovers
+            # are dispatched straight to the sections, so a modal that shows up
+            # after the map does not get in their way.
             try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, modal_selectors))
+                self.wait.until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, f'{_MODAL_SELECTOR}, [data-section-name]'))
                 )
-                modal_indicators = self.driver.find_elements(By.CSS_SELECTOR, modal_selectors)
             except TimeoutException:
                 return
 
-            # Filter to only displayed modals
-            visible_modals = [modal for modal in modal_indicators if modal.is_displayed()]
-
-            if not visible_modals:
+            # Check for a displayed modal in one call rather than is_displayed() per match
+            if not self.driver.execute_script(_ANY_VISIBLE_JS, _MODAL_SELECTOR):
                 return
 
-            # Expanded accept selectors to catch more button types
-            combined_selector = ', '.join([
-                'button[data-analytics="accept-modal-accept-button"]',
-                'button[data-testid*="agree"]'
-            ])
-
             try:
                 # Wait for accept button to become clickable
-                accept_button = WebDriverWait(self.driver, 6).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, combined_selector))
+                accept_button = WebDriverWait(self.driver, 6, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, _MODAL_ACCEPT_SELECTOR))
                 )
                 accept_button.click()
                 logger.debug("Clicked popup accept button")
-                time.sleep(1.5)  # Allow time for popup to dismiss
+
+                # Wait for the modal to go away rather than a fixed delay
+                WebDriverWait(self.driver, 3, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                    EC.invisibility_of_element_located((By.CSS_SELECTOR, _MODAL_SELECTOR))
+                )
             except TimeoutException:
                 logger.debug("No accept button found")
 
         except Exception as e:
             logger.debug(f"Error handling popup: {e}")
 
-    def _extract_section_price(self, section_name: str) -> Optional[Dict[str, Any]]:
+    def _prefetch_urls(self, urls: List[str]) -> None:
         """
-        Extract price for a specific section by hovering and reading popup.
+        Ask the browser to prefetch pages in the background.
+
+        Warms DNS, TLS and the HTTP cache for the next scrape using idle time
+        during hover waits.
 
         Args:
-            section_name: The section name to hover over
+            urls: Page URLs to prefetch
+        """
+        try:
+            self.driver.execute_script(_PREFETCH_JS, urls)
+            logger.debug(f"Prefetching {len(urls)} upcoming URLs")
+        except Exception as e:
+            logger.debug(f"Prefetch hint failed: {e}")
+
+    def _find_section_elements(self, sections: List[str]) -> Dict[str, Any]:
+        """
+        Resolve all requested sections to map elements in one WebDriver call.
+
+        Args:
+            sections: Section names to look up
 
         Returns:
-            Dictionary with price information or None if not found
+            Dictionary mapping section names to WebElements (missing sections omitted)
         """
         try:
-            # Find the section element
-            section_selector = f'[data-section-name="{section_name}"]'
-            section_element = None
+            return self.driver.execute_script(_FIND_SECTIONS_JS, sections) or {}
+        except Exception as e:
+            logger.debug(f"Batch section lookup failed: {e}")
+            return {}
+
+    def _clear_performance_log(self) -> None:
+        """Discard performance log entries buffered before the next navigation."""
+        try:
+            self.driver.get_log('performance')
+        except Exception as e:
+            logger.debug(f"Performance log unavailable: {e}")
+
+    def _capture_pricing_responses(self, page_url: str) -> List[Any]:
+        """
+        Read pricing JSON the current page has fetched from the performance log.
 
-            # Strategy 1: Direct data-section-name attribute
+        The log is cleared just before each navigation, but responses from the
+        previous page can still land after that. Only responses whose loaderId
+        belongs to this navigation's document request are kept.
+
+        Args:
+            page_url: URL the driver navigated to
+
+        Returns:
+            List of decoded JSON response bodies (empty if none were captured)
+        """
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception as e:
+            logger.debug(f"Performance log unavailable: {e}")
+            return []
+
+        messages = []
+        for entry in entries:
+            try:
+                messages.append(json.loads(entry['message'])['message'])
+            except Exception as e:
+                logger.debug(f"Skipping performance log entry: {e}")
+
+        # The navigation's document request; its redirects and every request
+        # the page makes afterwards share its loaderId
+        loader_id = next((
+            message['params'].get('loaderId') for message in messages
+            if message.get('method') == 'Network.requestWillBeSent'
+            and message.get('params', {}).get('type') == 'Document'
+            and message['params'].get('request', {}).get('url') == page_url
+        ), None)
+
+        if loader_id is None:
+            logger.debug("Page navigation not found in performance log")
+            return []
+
+        payloads = []
+        for message in messages:
             try:
-                section_element = self.driver.find_element(By.CSS_SELECTOR, section_selector)
-            except NoSuchElementException:
-                pass
+                if message.get('method') != 'Network.responseReceived':
+                    continue
+                params = message['params']
+                response = params['response']
+                if params.get('loaderId') != loader_id:
+                    continue
+                if 'json' not in response.get('mimeType', '') or not _PRICING_URL_RE.search(response.get('url', '')):
+                    continue
+                body = self.driver.execute_cdp_cmd(
+                    'Network.getResponseBody', {'requestId': params['requestId']}
+                )
+                payloads.append(json.loads(body['body']))
+            except Exception as e:
+                logger.debug(f"Skipping network response: {e}")
 
-            # Strategy 2: Partial match on data-section-name
-            if not section_element:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, '[data-section-name]')
-                    for elem in elements:
-                        if section_name.lower() in elem.get_attribute('data-section-name').lower():
-                            section_element = elem
-                            break
-                except Exception:
-                    pass
+        logger.debug(f"Captured {len(payloads)} pricing responses")
+        return payloads
+
+    def _extract_all_sections_js(self, sections: List[str], max_wait: float = 5) -> Dict[str, Optional[str]]:
+        """
+        Hover every section and read its tooltip in a single WebDriver call.
+
+        Args:
+            sections: Section names to hover
+            max_wait: Maximum seconds to wait for each section's popup
+
+        Returns:
+            Dictionary mapping section names to tooltip text (None if no popup
+            appeared); sections that were not found or are unavailable are omitted
+        """
+        if not sections:
+            return {}
+
+        try:
+            # The whole batch runs inside one async script, so allow for every
+            # wait, then put back the timeout later scripts on this driver expect
+            previous_timeout = self.driver.timeouts.script
+            self.driver.set_script_timeout(len(sections) * (max_wait + 1) + 5)
+            try:
+                return self.driver.execute_async_script(
+                    _HOVER_ALL_SECTIONS_JS, sections, _TOOLTIP_SELECTOR, max_wait
+                ) or {}
+            finally:
+                self.driver.set_script_timeout(previous_timeout)
+        except Exception as e:
+            logger.debug(f"Batch section hover failed: {e}")
+            return {}
+
+    def _extract_section_price(self, section_name: str, section_element=None,
+                               search_attributes: bool = True,
+                               synthetic_hover: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Extract price for a specific section by hovering and reading popup.
+
+        Args:
+            section_name: The section name to hover over
+            section_element: Pre-resolved map element; looked up if None
+            search_attributes: False when the section index has already been
+                searched, so only the text fallback is tried
+            synthetic_hover: False when dispatched events have already been
+                tried on this section, so only the real mouse hover is left
+
+        Returns:
+            Dictionary with price information or None if not found
+        """
+        try:
+            # Case-insensitive substring match on the section attribute
+            if not section_element and search_attributes:
+                matches = self.driver.find_elements(
+                    By.CSS_SELECTOR, f'[data-section-name*={_css_string(section_name)} i]'
+                )
+                if matches:
+                    section_element = matches[0]
 
-            # Strategy 3: Look for section in text content
+            # Last resort: look for the section name in text content
             if not section_element:
                 try:
-                    xpath = f"//*[contains(text(), '{section_name}')]"
-                    section_element = self.driver.find_element(By.XPATH, xpath)
+                    section_element = self.driver.find_element(By.XPATH, _section_xpath(section_name))
                 except NoSuchElementException:
                     pass
 
@@ -330,33 +1337,12 @@ class SectionBasedScraper:
                 logger.debug(f"Section not found: {section_name}")
                 return None
 
-            # Scroll element into view
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", section_element)
-            time.sleep(1)
-
-            # Try hovering with retry mechanism
-            price_data = None
-            max_retries = 2
-
-            for attempt in range(max_retries):
-                try:
-                    # Hover over the section
-                    actions = ActionChains(self.driver)
-                    actions.move_to_element(section_element).perform()
-
-                    # Wait for popup to appear with explicit wait
-                    price_data = self._wait_for_popup_and_extract_price(section_name)
-
-                    if price_data:
-                        break  # Success, exit retry loop
-                    elif attempt < max_retries - 1:
-                        # Move mouse away and wait before retry
-                        actions.move_by_offset(50, 50).perform()
-                        time.sleep(1)
-
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        raise
+            # Hover over the section and read its popup in one round trip
+            popup_text = self._hover_and_read_popup(section_element, synthetic=synthetic_hover)
+            if popup_text is False:
+                logger.debug(f"Section unavailable, skipping: {section_name}")
+                return None
+            price_data = self._extract_price_from_element(popup_text) if popup_text else None
 
             if price_data:
                 price_data['section'] = section_name
@@ -373,79 +1359,91 @@ class SectionBasedScraper:
             logger.debug(f"Could not process section '{section_name}': {e}")
             return None
 
-    def _wait_for_popup_and_extract_price(self, section_name: str, max_wait: float = 5) -> Optional[Dict[str, Any]]:
+    def _hover_and_read_popup(self, section_element, max_wait: float = 5,
+                              synthetic: bool = True) -> Union[str, bool, None]:
         """
-        Wait for popup to appear after hover and extract price information.
+        Hover a section and read its price popup.
+
+        Pointer and mouse events are first dispatched straight to the element,
+        reading the popup in the same WebDriver call. Maps that ignore
+        synthetic events, for example by checking isTrusted, show no popup
+        for those, so a real mouse hover is tried next.
 
         Args:
-            section_name: Name of the section being hovered
-            max_wait: Maximum seconds to wait for popup
+            section_element: Map element to hover
+            max_wait: Maximum seconds to wait for the popup on each attempt
+            synthetic: Dispatch events first; False goes straight to the mouse
 
         Returns:
-            Dictionary with price information or None if not found
+            Popup text, None if no popup appeared, or False if the section is
+            unavailable and was not hovered
         """
-        try:
-            # Combine all popup selectors into a single efficient query
-            combined_popup_selector = '[data-bdd="hover-tool-tip-container"]'
-            popup_element = None
-
-            # Single optimized wait for any popup
-            try:
-                popup_element = WebDriverWait(self.driver, max_wait).until(
-                    EC.visibility_of_element_located((By.CSS_SELECTOR, combined_popup_selector))
-                )
-
-                # Additional check that it has meaningful text content
-                if not popup_element.text.strip():
-                    popup_element = None
+        popup_text = None
+        if synthetic:
+            popup_text = self.driver.execute_async_script(
+                _HOVER_SECTION_JS, section_element, _TOOLTIP_SELECTOR, max_wait
+            )
+        if popup_text is None:
+            popup_text = self._trusted_hover_and_read_popup(section_element, max_wait)
+        return popup_text
+
+    def _trusted_hover_and_read_popup(self, section_element, max_wait: float = 5) -> Optional[str]:
+        """
+        Hover a section with the real mouse and read its price popup.
 
-            except TimeoutException:
-                return None
+        The mouse move is sent through CDP, so the page sees a trusted event
+        at the section's centre.
 
-            if popup_element:
-                # Extract price from the popup
-                return self._extract_price_from_element(popup_element)
-            else:
-                return None
+        Args:
+            section_element: Map element to hover
+            max_wait: Maximum seconds to wait for the popup
 
+        Returns:
+            Popup text, or None if no popup appeared
+        """
+        try:
+            centre = self.driver.execute_script(_SECTION_CENTER_JS, section_element)
+            self.driver.execute_cdp_cmd('Input.dispatchMouseEvent', {
+                'type': 'mouseMoved', 'x': centre['x'], 'y': centre['y']
+            })
+            return self.driver.execute_async_script(_READ_TOOLTIP_JS, _TOOLTIP_SELECTOR, max_wait)
         except Exception as e:
-            logger.debug(f"Error waiting for popup: {e}")
+            logger.debug(f"Trusted hover failed: {e}")
             return None
+        finally:
+            # Park the mouse in the corner so this popup closes before the next hover
+            try:
+                self.driver.execute_cdp_cmd('Input.dispatchMouseEvent', {'type': 'mouseMoved', 'x': 0, 'y': 0})
+            except Exception as e:
+                logger.debug(f"Could not move mouse away: {e}")
 
-    def _extract_price_from_element(self, popup_element) -> Optional[Dict[str, Any]]:
+    def _extract_price_from_element(self, popup_text: str) -> Optional[Dict[str, Any]]:
         """
-        Extract price information from a popup element.
+        Extract price information from popup text.
 
         Args:
-            popup_element: WebElement containing the popup
+            popup_text: Text content of the popup
 
         Returns:
             Dictionary with price information or None if not found
         """
         try:
-            # Get popup text
-            popup_text = popup_element.text
-
-            # Extract price from popup text
-            price_patterns = [
-                r'\$([0-9]+(?:\.[0-9]{2})?)\+?',  # $99.99 or $99.99+
-                r'\$([0-9]+(?:\.[0-9]{2})?)',  # $99.99
-                r'([0-9]+(?:\.[0-9]{2})?)\s*(?:USD|dollars?)',  # 99.99 USD
-                r'(?:from|starting at|as low as)\s*\$([0-9]+(?:\.[0-9]{2})?)\+?',  # from $99.99+
-                r'Price:\s*\$([0-9]+(?:\.[0-9]{2})?)\+?',  # Price: $99.99+
-            ]
-
-            for pattern in price_patterns:
-                match = re.search(pattern, popup_text, re.IGNORECASE)
-                if match:
-                    price = float(match.group(1))
-                    logger.debug(f"Extracted price: ${price}")
-
-                    return {
-                        'price': price,
-                        'text': popup_text,
-                        'currency': 'USD'
-                    }
+            # Most popups without a price ("Sold out") have no currency marker at all
+            if '$' not in popup_text:
+                lowered = popup_text.lower()
+                if 'usd' not in lowered and 'dollar' not in lowered:
+                    return None
+
+            match = _PRICE_RE.search(popup_text)
+            if match:
+                price = float(match.group('dollars') or match.group('amount'))
+                logger.debug(f"Extracted price: ${price}")
+
+                return {
+                    'price': price,
+                    'text': popup_text,
+                    'currency': 'USD'
+                }
 
             return None
 
@@ -454,16 +1452,21 @@ class SectionBasedScraper:
             return None
 
     def close(self) -> None:
-        """Close the WebDriver and clean up temporary files."""
+        """Return the WebDriver to the pool, or quit it if it is not reused."""
         if self.driver:
             try:
-                # Force quit all Chrome processes before closing WebDriver
-                self.driver.quit()
-                # Additional cleanup for Codespaces - wait a bit for processes to terminate
-                time.sleep(2)
+                if self.reuse_driver:
+                    # Stop any page activity before the driver sits idle
+                    self.driver.get("about:blank")
+                    if _DRIVER_POOLS[self.headless].release(self.driver):
+                        logger.debug("Returned WebDriver to pool")
+                        return
+
+                _quit_driver(self.driver)
 
             except Exception as e:
                 logger.error(f"Error closing WebDriver: {e}")
+                _quit_driver(self.driver)
             finally:
                 self.driver = None
                 self.wait = None
@@ -474,4 +1477,4 @@ class SectionBasedScraper:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.close()
\ No newline at end of file
+        self.close()
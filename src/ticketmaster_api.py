@@ -6,14 +6,20 @@ to fetch event details and ticket pricing information.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlencode
 import os
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # Optional; responses are parsed with the stdlib json module instead
+    orjson = None
+
 from .rate_limiter import RateLimiter
 from .api_cache import APICache
 
@@ -22,6 +28,44 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Most event IDs the /events endpoint accepts in one request (its page size limit)
+BULK_EVENT_LIMIT = 200
+
+# Keep-alive connections held open to the API host, so concurrent callers
+# sharing one client reuse TLS sessions instead of reconnecting
+HTTP_POOL_SIZE = 20
+
+
+def _cache_key(url: str, params: Dict[str, Any]) -> str:
+    """
+    Build the cache key for a request.
+    
+    Parameters are sorted so their order does not matter, and the API key is
+    left out so cached entries survive key rotation and never hold the secret.
+    
+    Args:
+        url: Full request URL
+        params: Query parameters
+        
+    Returns:
+        Cache key string
+    """
+    query = urlencode(sorted((k, v) for k, v in params.items() if k != 'apikey'))
+    return f"{url}?{query}"
+
+
+def _event_cache_key(event_id: str) -> str:
+    """
+    Build the cache key for an event's parsed details.
+    
+    Args:
+        event_id: Ticketmaster event ID
+        
+    Returns:
+        Cache key string
+    """
+    return f"event:{event_id}"
+
 
 class TicketmasterAPIError(Exception):
     """Base exception for Ticketmaster API errors."""
@@ -67,6 +111,7 @@ class TicketmasterAPI:
         
         self.cache_duration = cache_duration
         self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE))
         
         # Initialize rate limiter and cache
         self.rate_limiter = RateLimiter(max_requests=5000, time_window=86400)  # 5000 per day
@@ -99,9 +144,8 @@ class TicketmasterAPI:
             AuthenticationError: If authentication fails
             TicketmasterAPIError: For other API errors
         """
-        # Set up parameters
-        if params is None:
-            params = {}
+        # Set up parameters without modifying the caller's dict
+        params = dict(params or {})
         params['apikey'] = self.api_key
         
         # Build full URL - ensure proper joining
@@ -111,7 +155,7 @@ class TicketmasterAPI:
         
         # Check cache first if enabled
         if use_cache:
-            cache_key = f"{url}:{str(sorted(params.items()))}"
+            cache_key = _cache_key(url, params)
             cached_response = self.cache.get(cache_key)
             if cached_response is not None:
                 logger.debug(f"Cache hit for {endpoint}")
@@ -123,20 +167,25 @@ class TicketmasterAPI:
         
         try:
             logger.debug(f"Making API request to {endpoint}")
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             response = self.session.get(url, params=params, timeout=30)
             
             # Log response time
-            response_time = time.time() - start_time
-            logger.debug(f"API request completed in {response_time:.2f}s")
+            response_time = time.perf_counter() - start_time
+            logger.debug(f"API request to {endpoint} completed in {response_time * 1000:.1f}ms")
             
             # Record the request for rate limiting
             self.rate_limiter.record_request()
             
             # Handle different response codes
             if response.status_code == 200:
-                data = response.json()
+                try:
+                    data = orjson.loads(response.content) if orjson else response.json()
+                except ValueError as e:
+                    # orjson's decode error is not a RequestException, so wrap it here
+                    logger.error(f"Invalid JSON in response from {endpoint}: {e}")
+                    raise TicketmasterAPIError(f"Invalid JSON response: {e}")
                 
                 # Cache successful response
                 if use_cache:
@@ -192,18 +241,29 @@ class TicketmasterAPI:
                 'timezone': 'America/New_York',
                 'url': 'https://www.ticketmaster.com/event/...',
                 'status': 'onsale',
-                'price_ranges': [...]
+                'price_ranges': [...],
+                'prices': [...]
             }
         """
         try:
+            # Parsed details are cached instead of the raw response, so a hit
+            # decodes a small dict rather than the full event payload
+            cache_key = _event_cache_key(event_id)
+            event_data = self.cache.get(cache_key)
+            if event_data is not None:
+                logger.debug(f"Cache hit for event {event_id}")
+                return event_data
+            
             endpoint = f"/events/{event_id}"
-            response = self._make_request(endpoint)
+            response = self._make_request(endpoint, use_cache=False)
             
             if not response:
                 return None
             
             # Extract event data
             event_data = self._parse_event_details(response)
+            if event_data:
+                self.cache.set(cache_key, event_data)
             
             logger.info(f"Retrieved event details for {event_id}: {event_data.get('name', 'Unknown')}")
             return event_data
@@ -215,6 +275,56 @@ class TicketmasterAPI:
             logger.error(f"Failed to get event details for {event_id}: {e}")
             return None
     
+    def get_events_bulk(self, event_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get details for several events, fetching uncached ones in batched requests.
+        
+        Each event is cached under its own key, so later get_event_details
+        calls for the same events are served from the cache.
+        
+        Args:
+            event_ids: Ticketmaster event IDs
+            
+        Returns:
+            Dictionary mapping event IDs to event details (events not found omitted)
+        """
+        requested = list(dict.fromkeys(event_ids))
+        cached = self.cache.get_many([_event_cache_key(event_id) for event_id in requested])
+        events = {}
+        missing = []
+        
+        for event_id in requested:
+            event_data = cached.get(_event_cache_key(event_id))
+            if event_data is not None:
+                events[event_id] = event_data
+            else:
+                missing.append(event_id)
+        
+        for start in range(0, len(missing), BULK_EVENT_LIMIT):
+            batch = missing[start:start + BULK_EVENT_LIMIT]
+            try:
+                params = {'id': ','.join(batch), 'size': len(batch)}
+                response = self._make_request("/events", params, use_cache=False)
+                
+                if not response or '_embedded' not in response:
+                    continue
+                
+                fetched = {}
+                for event in response['_embedded'].get('events', []):
+                    event_data = self._parse_event_details(event)
+                    if event_data and event_data.get('id'):
+                        fetched[event_data['id']] = event_data
+                
+                self.cache.set_many({_event_cache_key(event_id): event_data
+                                     for event_id, event_data in fetched.items()})
+                events.update(fetched)
+                        
+            except Exception as e:
+                logger.error(f"Failed to get events in bulk: {e}")
+        
+        logger.info(f"Retrieved {len(events)}/{len(requested)} events ({len(missing)} not cached)")
+        return events
+    
     def get_ticket_prices(self, event_id: str) -> List[Dict]:
         """
         Get current ticket pricing information for an event.
@@ -245,8 +355,10 @@ class TicketmasterAPI:
                 logger.warning(f"No event details found for {event_id}")
                 return []
             
-            # Extract pricing information
-            prices = self._parse_pricing_data(event_details)
+            # Pricing entries are shaped while the event is parsed
+            prices = event_details.get('prices', [])
+            if not prices:
+                logger.debug("No price ranges found in event data")
             
             logger.info(f"Retrieved {len(prices)} price entries for event {event_id}")
             return prices
@@ -327,7 +439,8 @@ class TicketmasterAPI:
                 'name': event.get('name'),
                 'url': event.get('url'),
                 'status': event.get('dates', {}).get('status', {}).get('code', 'unknown'),
-                'price_ranges': []
+                'price_ranges': [],
+                'prices': []
             }
             
             # Extract venue information
@@ -360,18 +473,24 @@ class TicketmasterAPI:
                     'max': price_range.get('max')
                 })
             
+            # Shape ticket price entries now, so a cached event needs no further work
+            event_data['prices'] = self._parse_pricing_data(price_ranges)
+            
             return event_data
             
         except Exception as e:
             logger.error(f"Failed to parse event details: {e}")
             return None
     
-    def _parse_pricing_data(self, event_data: Dict) -> List[Dict]:
+    def _parse_pricing_data(self, price_ranges: List[Dict]) -> List[Dict]:
         """
-        Parse pricing data from event details.
+        Parse pricing data from an event's price ranges.
+        
+        A malformed range only costs the prices; the event itself is still
+        parsed.
         
         Args:
-            event_data: Parsed event data
+            price_ranges: Raw priceRanges entries from the API response
             
         Returns:
             List of pricing dictionaries
@@ -379,22 +498,17 @@ class TicketmasterAPI:
         prices = []
         
         try:
-            # Extract price ranges
-            for price_range in event_data.get('price_ranges', []):
+            for price_range in price_ranges:
                 if price_range.get('min') is not None:
                     prices.append({
-                        'section': price_range.get('type', 'General'),
+                        'section': price_range.get('type') or 'General',
                         'price': float(price_range['min']),
-                        'price_max': float(price_range.get('max', price_range['min'])),
-                        'currency': price_range.get('currency', 'USD'),
+                        'price_max': float(price_range.get('max') or price_range['min']),
+                        'currency': price_range.get('currency') or 'USD',
                         'type': 'primary',
                         'availability': 'available'
                     })
             
-            # If no price ranges, create a placeholder
-            if not prices:
-                logger.debug("No price ranges found in event data")
-            
             return prices
             
         except Exception as e:
@@ -0,0 +1,56 @@
+"""
+Tests for API response caching in TixScanner.
+
+This module contains tests for the SQLite-backed APICache used by
+the Ticketmaster API client.
+"""
+
+import pytest
+import tempfile
+import os
+
+from src.api_cache import APICache
+
+
+@pytest.fixture
+def temp_db():
+    """Create temporary database path for testing."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as tmp:
+        db_path = tmp.name
+    
+    yield db_path
+    
+    if os.path.exists(db_path):
+        os.unlink(db_path)
+
+
+class TestBatchAccess:
+    """Test reading and writing several keys at once."""
+    
+    def test_set_many_then_get_many(self, temp_db):
+        """Test that values stored together are read back together."""
+        cache = APICache(db_path=temp_db)
+        
+        assert cache.set_many({'event:E1': {'id': 'E1'}, 'event:E2': {'id': 'E2'}}) == True
+        
+        assert cache.get_many(['event:E1', 'event:E2', 'event:E3']) == {
+            'event:E1': {'id': 'E1'},
+            'event:E2': {'id': 'E2'}
+        }
+        assert cache.get('event:E2') == {'id': 'E2'}
+    
+    def test_get_many_counts_access(self, temp_db):
+        """Test that batched reads update the access statistics."""
+        cache = APICache(db_path=temp_db)
+        cache.set('event:E1', {'id': 'E1'})
+        
+        cache.get_many(['event:E1'])
+        
+        assert cache.get_stats()['max_access_count'] == 2
+    
+    def test_empty_batches_do_nothing(self, temp_db):
+        """Test that empty batches return without touching the database."""
+        cache = APICache(db_path=temp_db)
+        
+        assert cache.get_many([]) == {}
+        assert cache.set_many({}) == True
@@ -0,0 +1,179 @@
+"""
+Tests for the optimized Ticketmaster scraper in TixScanner.
+
+These tests cover the parsing helpers that run on HTML already fetched
+from the browser, so no WebDriver is started.
+"""
+
+import pytest
+from unittest.mock import MagicMock, PropertyMock, patch
+from bs4 import BeautifulSoup
+
+from src.optimized_scraper import TicketmasterOptimizedScraper
+from src.section_scraper import SectionBasedScraper
+
+
+EVENT_PAGE = """
+<html>
+<head><script>window.bundle = "$999.00";</script><style>.price { color: red; }</style></head>
+<body>
+    <nav class="menu">Tickets from $5</nav>
+    <div data-bdd="qp-split-scroll" class="list-container">
+        <div class="seat-row">
+            <span class="section-label">General Admission</span>
+            <span class="price-tag">$85.00</span>
+        </div>
+        <div class="seat-row">
+            <span class="section-label">Floor</span>
+            <span class="price-tag">$150.00</span>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def scraper():
+    """Create a scraper instance without starting a browser."""
+    return TicketmasterOptimizedScraper.__new__(TicketmasterOptimizedScraper)
+
+
+class TestPricingParse:
+    """Test parsing of the price-bearing parts of a page."""
+    
+    def test_pricing_fragment_read_from_browser(self, scraper):
+        """Test that the price-bearing fragment is parsed instead of the page source."""
+        scraper.driver = MagicMock()
+        scraper.driver.execute_script.return_value = \
+            '<div class="seat-row"><span class="section-label">Floor</span>' \
+            '<span class="price-tag">$150.00</span></div>'
+        page_source = PropertyMock(return_value=EVENT_PAGE)
+        type(scraper.driver).page_source = page_source
+        
+        sections = scraper._extract_section_prices(scraper._read_pricing_html())
+        
+        assert sections['Floor']['min_price'] == 150.0
+        page_source.assert_not_called()
+    
+    def test_fragment_has_same_prices_as_full_page(self, scraper):
+        """Test that the price elements with their ancestors price sections like the whole page."""
+        full = BeautifulSoup(EVENT_PAGE, 'html.parser')
+        fragment = str(full.select_one('[data-bdd="qp-split-scroll"]'))
+        scraper.driver = MagicMock()
+        scraper.driver.execute_script.return_value = fragment
+        
+        partial = scraper._extract_section_prices(scraper._read_pricing_html())
+        
+        assert {name: data['min_price'] for name, data in partial.items()} == \
+               {name: data['min_price'] for name, data in scraper._extract_section_prices(full).items()}
+    
+    def test_page_without_price_elements_has_no_prices(self, scraper):
+        """Test that an empty fragment gives an empty tree without reading the page source."""
+        scraper.driver = MagicMock()
+        scraper.driver.execute_script.return_value = None
+        page_source = PropertyMock(return_value=EVENT_PAGE)
+        type(scraper.driver).page_source = page_source
+        
+        assert scraper._extract_section_prices(scraper._read_pricing_html()) == {}
+        page_source.assert_not_called()
+
+
+class TestPriceExtraction:
+    """Test price and section extraction from parsed elements."""
+    
+    def test_element_matching_several_selectors_counted_once(self, scraper):
+        """Test that an element matching more than one price selector is only counted once."""
+        html = '<div class="seat-row"><span class="section-label">Floor</span>' \
+               '<span class="price-amount" data-price="100">$100.00</span></div>' \
+               '<div class="seat-row"><span class="section-label">Floor</span>' \
+               '<span class="price-tag">$50.00</span></div>'
+        
+        sections = scraper._extract_section_prices(BeautifulSoup(html, 'html.parser'))
+        
+        assert sections['Floor']['avg_price'] == 75.0
+    
+    def test_parse_price_string(self, scraper):
+        """Test parsing of formatted price strings."""
+        assert scraper._parse_price_string('$1,250.50') == 1250.50
+        assert scraper._parse_price_string('From $85') == 85.0
+        assert scraper._parse_price_string('$5.00') is None
+        assert scraper._parse_price_string('') is None
+    
+    def test_section_label_and_range_match(self, scraper):
+        """Test section labels are read from text and matched against numeric ranges."""
+        soup = BeautifulSoup('<span class="price">Sec 104 $90</span>', 'html.parser')
+        
+        section_name = scraper._extract_section_info(soup.span)
+        
+        assert section_name == 'Section 104'
+        assert scraper._matches_target_section(section_name, ['10s'])
+        assert not scraper._matches_target_section(section_name, ['20s'])
+
+
+class TestSharedScraper:
+    """Test the process-wide shared scraper."""
+    
+    @patch.object(TicketmasterOptimizedScraper, '_setup_driver')
+    def test_get_shared_returns_same_instance(self, mock_setup):
+        """Test that repeated calls reuse one scraper and one browser."""
+        with patch.dict('src.section_scraper._SHARED_SCRAPERS', clear=True):
+            first = TicketmasterOptimizedScraper.get_shared(headless=True, timeout=30)
+            first.driver = MagicMock()
+            second = TicketmasterOptimizedScraper.get_shared(headless=True, timeout=30)
+            other = TicketmasterOptimizedScraper.get_shared(headless=True, timeout=10)
+        
+        assert first is second
+        assert other is not first
+        assert mock_setup.call_count == 2
+    
+    @patch.object(TicketmasterOptimizedScraper, '_setup_driver')
+    def test_get_shared_restarts_closed_scraper(self, mock_setup):
+        """Test that a shared scraper closed by a caller gets a new driver."""
+        with patch.dict('src.section_scraper._SHARED_SCRAPERS', clear=True):
+            first = TicketmasterOptimizedScraper.get_shared()
+            first.close()
+            second = TicketmasterOptimizedScraper.get_shared()
+        
+        assert first is second
+        assert mock_setup.call_count == 2
+    
+    @patch.object(SectionBasedScraper, '_setup_driver')
+    @patch.object(TicketmasterOptimizedScraper, '_setup_driver')
+    def test_shared_registry_is_kept_per_class(self, mock_setup, mock_section_setup):
+        """Test that both scraper classes share one registry without handing out each other's instances."""
+        with patch.dict('src.section_scraper._SHARED_SCRAPERS', clear=True):
+            optimized = TicketmasterOptimizedScraper.get_shared(headless=True, timeout=30)
+            section = SectionBasedScraper.get_shared(headless=True, timeout=30)
+        
+        assert isinstance(optimized, TicketmasterOptimizedScraper)
+        assert isinstance(section, SectionBasedScraper)
+
+
+class TestDynamicContent:
+    """Test waiting for prices rendered while scrolling."""
+    
+    @patch('src.optimized_scraper.time.sleep')
+    def test_wait_returns_once_more_prices_render(self, mock_sleep, scraper):
+        """Test that a scroll step stops waiting as soon as new prices appear."""
+        scraper.driver = MagicMock()
+        scraper.driver.execute_script.side_effect = [4, 4, 9]
+        
+        assert scraper._wait_for_more_prices(4) == 9
+        assert scraper.driver.execute_script.call_count == 3
+        assert mock_sleep.call_args[0][0] < 1
+    
+    @patch('src.optimized_scraper.time.sleep')
+    def test_scrolling_stops_when_no_new_prices(self, mock_sleep, scraper):
+        """Test that the remaining scroll steps are skipped once a step loads nothing."""
+        scraper.driver = MagicMock()
+        scraper._wait_for_more_prices = MagicMock(side_effect=[6, 6, 6])
+        
+        with patch('src.optimized_scraper.WebDriverWait') as mock_wait:
+            mock_wait.return_value.until.return_value = MagicMock()
+            scraper._load_dynamic_content()
+        
+        # First step loads prices, second loads none, then the final scroll
+        assert scraper._wait_for_more_prices.call_args_list == [
+            ((0,),), ((6,),), ((6,),)
+        ]
@@ -0,0 +1,216 @@
+"""
+Tests for the price monitoring engine in TixScanner.
+
+The Ticketmaster API client and the section scraper are mocked, so no
+network access happens and no browser is started.
+"""
+
+import os
+import tempfile
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.database import initialize_database
+from src.db_operations import add_concert
+from src.models import Concert
+from src.price_monitor import PriceMonitor, SCRAPE_CONCURRENCY
+from src.ticketmaster_api import TicketmasterAPI
+
+
+def parsed_event(event_id, price_ranges=None):
+    """Build event details the way TicketmasterAPI.get_event_details returns them."""
+    response = {
+        'id': event_id,
+        'name': f'Concert {event_id}',
+        'url': f'https://www.ticketmaster.com/event/{event_id}',
+        'dates': {'status': {'code': 'onsale'}}
+    }
+    if price_ranges is not None:
+        response['priceRanges'] = price_ranges
+    return TicketmasterAPI.__new__(TicketmasterAPI)._parse_event_details(response)
+
+
+def scrape_result(event_id, prices):
+    """Build a SectionBasedScraper.scrape_section_prices result for an event."""
+    return {
+        'url': f'https://www.ticketmaster.com/event/{event_id}',
+        'sections': {name: {'price': price, 'section': name} for name, price in prices.items()},
+        'success': bool(prices),
+        'error': None if prices else "No section prices found"
+    }
+
+
+@pytest.fixture
+def temp_db():
+    """Create temporary database with the tracked concerts already stored."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as tmp:
+        db_path = tmp.name
+    
+    initialize_database(db_path)
+    for event_id in ('E1', 'E2', 'E3'):
+        add_concert(Concert(
+            event_id=event_id,
+            name=f'Concert {event_id}',
+            venue='Test Venue',
+            event_date=date(2030, 6, 1),
+            threshold_price=Decimal('10.00')
+        ), db_path)
+    yield db_path
+    
+    if os.path.exists(db_path):
+        os.unlink(db_path)
+
+
+@pytest.fixture
+def monitor():
+    """Create a price monitor with a mocked API client and no configuration file."""
+    price_monitor = PriceMonitor.__new__(PriceMonitor)
+    price_monitor.db_path = None
+    price_monitor.api_client = MagicMock()
+    price_monitor.email_client = MagicMock()
+    price_monitor.enable_scraping = True
+    price_monitor.scraper = None
+    price_monitor.section_scraper = None
+    price_monitor._prefetched_scrapes = {}
+    price_monitor.config_manager = None
+    price_monitor.section_preferences = {}
+    price_monitor.section_thresholds = {}
+    price_monitor.min_price_drop_percent = 10.0
+    price_monitor.check_frequency_hours = 2
+    return price_monitor
+
+
+class TestApiPricing:
+    """Test reading prices from parsed API event details."""
+    
+    def test_min_price_from_parsed_event(self):
+        """Test that the lowest parsed price is used."""
+        event = parsed_event('E1', [
+            {'type': 'standard', 'currency': 'USD', 'min': 45.5, 'max': 120.0},
+            {'type': 'vip', 'currency': 'USD', 'min': 30.0, 'max': None}
+        ])
+        
+        assert PriceMonitor._api_min_price(event) == Decimal('30.0')
+    
+    def test_event_without_price_ranges_has_no_price(self):
+        """Test that events the API gives no prices for fall through to scraping."""
+        assert PriceMonitor._api_min_price(parsed_event('E1')) is None
+        assert PriceMonitor._api_min_price(None) is None
+    
+    def test_events_priced_by_api_are_not_scraped(self, monitor):
+        """Test that only events without API pricing are sent to the browser."""
+        events = {
+            'E1': parsed_event('E1', [{'type': 'standard', 'currency': 'USD', 'min': 45.5, 'max': 120.0}]),
+            'E2': parsed_event('E2'),
+            'E3': parsed_event('E3')
+        }
+        monitor.api_client.get_event_details.side_effect = events.get
+        monitor.section_preferences = {'E1': ['Floor'], 'E2': ['Floor'], 'E3': ['101']}
+        
+        with patch('src.price_monitor.SectionBasedScraper.scrape_events', return_value={}) as mock_scrape:
+            monitor._prefetch_section_prices(['E1', 'E2', 'E3'])
+        
+        mock_scrape.assert_called_once_with([
+            ('https://www.ticketmaster.com/event/E2', ['Floor']),
+            ('https://www.ticketmaster.com/event/E3', ['101'])
+        ], concurrency=SCRAPE_CONCURRENCY, headless=True)
+
+
+class TestCheckAllPrices:
+    """Test a full price check cycle with prefetched section scrapes."""
+    
+    @pytest.fixture
+    def cycle_monitor(self, monitor, temp_db):
+        """Monitor tracking three events, two of which need section scraping."""
+        events = {
+            'E1': parsed_event('E1', [{'type': 'standard', 'currency': 'USD', 'min': 45.5, 'max': 120.0}]),
+            'E2': parsed_event('E2'),
+            'E3': parsed_event('E3')
+        }
+        monitor.db_path = temp_db
+        monitor.config_manager = MagicMock()
+        monitor.config_manager.get_concert_config.return_value = {
+            'E1': Decimal('10.00'), 'E2': Decimal('10.00'), 'E3': Decimal('10.00')
+        }
+        monitor.section_preferences = {'E2': ['Floor'], 'E3': ['101']}
+        monitor.api_client.get_events_bulk.return_value = events
+        monitor.api_client.get_event_details.side_effect = events.get
+        return monitor
+    
+    @patch('src.price_monitor.SectionBasedScraper.get_shared')
+    def test_prefetched_results_are_consumed(self, mock_shared, cycle_monitor):
+        """Test that each event's parallel scrape is used instead of scraping again."""
+        with patch('src.price_monitor.SectionBasedScraper.scrape_events', return_value={
+            'https://www.ticketmaster.com/event/E2': scrape_result('E2', {'Floor': 85.0}),
+            'https://www.ticketmaster.com/event/E3': scrape_result('E3', {'101': 60.0})
+        }) as mock_scrape:
+            results = cycle_monitor.check_all_prices()
+        
+        by_event = {r['concert'].event_id: r for r in results['results']}
+        assert results['prices_checked'] == 3
+        assert by_event['E1']['section_prices'] == {'General': Decimal('45.5')}
+        assert by_event['E2']['section_prices'] == {'Floor': Decimal('85.0')}
+        assert by_event['E3']['section_prices'] == {'101': Decimal('60.0')}
+        mock_scrape.assert_called_once()
+        mock_shared.assert_not_called()
+        assert cycle_monitor._prefetched_scrapes == {}
+    
+    @patch('src.price_monitor.SectionBasedScraper.get_shared')
+    def test_prefetched_results_are_not_reused_next_cycle(self, mock_shared, cycle_monitor):
+        """Test that every cycle scrapes afresh rather than reading the last cycle's results."""
+        cycles = [
+            {'https://www.ticketmaster.com/event/E2': scrape_result('E2', {'Floor': 85.0}),
+             'https://www.ticketmaster.com/event/E3': scrape_result('E3', {'101': 60.0})},
+            {'https://www.ticketmaster.com/event/E2': scrape_result('E2', {'Floor': 70.0}),
+             'https://www.ticketmaster.com/event/E3': scrape_result('E3', {'101': 55.0})}
+        ]
+        
+        with patch('src.price_monitor.SectionBasedScraper.scrape_events', side_effect=cycles) as mock_scrape:
+            cycle_monitor.check_all_prices()
+            results = cycle_monitor.check_all_prices()
+        
+        by_event = {r['concert'].event_id: r for r in results['results']}
+        assert by_event['E2']['section_prices'] == {'Floor': Decimal('70.0')}
+        assert by_event['E3']['section_prices'] == {'101': Decimal('55.0')}
+        assert mock_scrape.call_count == 2
+        mock_shared.assert_not_called()
+    
+    @patch('src.price_monitor.SectionBasedScraper.get_shared')
+    def test_failed_prefetch_is_scraped_again(self, mock_shared, cycle_monitor):
+        """Test that an event whose parallel scrape failed falls back to the shared scraper."""
+        mock_shared.return_value.scrape_section_prices.return_value = scrape_result('E3', {'101': 58.0})
+        
+        with patch('src.price_monitor.SectionBasedScraper.scrape_events', return_value={
+            'https://www.ticketmaster.com/event/E2': scrape_result('E2', {'Floor': 85.0}),
+            'https://www.ticketmaster.com/event/E3': scrape_result('E3', {})
+        }):
+            results = cycle_monitor.check_all_prices()
+        
+        by_event = {r['concert'].event_id: r for r in results['results']}
+        assert by_event['E3']['section_prices'] == {'101': Decimal('58.0')}
+        mock_shared.return_value.scrape_section_prices.assert_called_once_with(
+            'https://www.ticketmaster.com/event/E3', sections=['101']
+        )
+    
+    @patch('src.price_monitor.SectionBasedScraper.get_shared')
+    def test_event_missing_from_bulk_result_is_still_checked(self, mock_shared, cycle_monitor):
+        """Test that an event the API did not return is scraped from its constructed URL."""
+        events = {'E1': cycle_monitor.api_client.get_events_bulk.return_value['E1']}
+        cycle_monitor.api_client.get_events_bulk.return_value = events
+        cycle_monitor.api_client.get_event_details.side_effect = events.get
+        
+        with patch('src.price_monitor.SectionBasedScraper.scrape_events', return_value={
+            'https://www.ticketmaster.com/event/E2': scrape_result('E2', {'Floor': 85.0}),
+            'https://www.ticketmaster.com/event/E3': scrape_result('E3', {'101': 60.0})
+        }) as mock_scrape:
+            results = cycle_monitor.check_all_prices()
+        
+        by_event = {r['concert'].event_id: r for r in results['results']}
+        assert [url for url, _ in mock_scrape.call_args.args[0]] == [
+            'https://www.ticketmaster.com/event/E2', 'https://www.ticketmaster.com/event/E3'
+        ]
+        assert by_event['E2']['section_prices'] == {'Floor': Decimal('85.0')}
+        assert results['errors'] == 0
@@ -0,0 +1,211 @@
+"""
+Tests for rate limiting in TixScanner.
+
+This module contains tests for the persistent RateLimiter used by
+the Ticketmaster API client.
+"""
+
+import pytest
+import tempfile
+import os
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from src.database import get_connection
+
+from src.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def temp_db():
+    """Create temporary database path for testing."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as tmp:
+        db_path = tmp.name
+    
+    yield db_path
+    
+    if os.path.exists(db_path):
+        os.unlink(db_path)
+
+
+class TestRateLimiter:
+    """Test request counting and limit checks."""
+    
+    def test_record_request_updates_usage(self, temp_db):
+        """Test that recorded requests count towards usage."""
+        limiter = RateLimiter(max_requests=5, time_window=86400, db_path=temp_db)
+        
+        limiter.record_request()
+        limiter.record_request()
+        
+        assert limiter.get_current_usage() == 2
+        assert limiter.get_remaining_requests() == 3
+    
+    def test_record_request_caches_returned_usage(self, temp_db):
+        """Test that the insert refreshes the in-memory usage count."""
+        limiter = RateLimiter(max_requests=5, time_window=86400, db_path=temp_db)
+        
+        limiter.record_request()
+        limiter.record_request()
+        
+        assert limiter._cached_usage == 2
+    
+    def test_can_make_request_respects_limit(self, temp_db):
+        """Test that requests are refused once the limit is reached."""
+        limiter = RateLimiter(max_requests=3, time_window=86400, db_path=temp_db)
+        
+        for _ in range(3):
+            assert limiter.can_make_request() == True
+            limiter.record_request()
+        
+        assert limiter.can_make_request() == False
+    
+    def test_can_make_request_skips_recount_far_below_limit(self, temp_db):
+        """Test that no usage query runs while usage is under half the limit."""
+        limiter = RateLimiter(max_requests=10, time_window=86400, db_path=temp_db)
+        limiter.record_request()
+        
+        with patch.object(limiter, 'get_current_usage') as mock_usage:
+            assert limiter.can_make_request() == True
+        
+        mock_usage.assert_not_called()
+    
+    @patch('src.rate_limiter._SQLITE_HAS_RETURNING', False)
+    def test_record_request_without_returning_support(self, temp_db):
+        """Test that requests are still recorded and counted on SQLite before 3.35."""
+        limiter = RateLimiter(max_requests=5, time_window=86400, db_path=temp_db)
+        
+        limiter.record_request()
+        limiter.record_request()
+        
+        assert limiter._cached_usage == 2
+        assert limiter.get_current_usage() == 2
+    
+    def test_can_make_request_recounts_near_limit(self, temp_db):
+        """Test that requests made by another process are seen once usage nears the limit."""
+        limiter = RateLimiter(max_requests=4, time_window=86400, db_path=temp_db)
+        other_process = RateLimiter(max_requests=4, time_window=86400, db_path=temp_db)
+        limiter.record_request()
+        limiter.record_request()
+        
+        other_process.record_request()
+        other_process.record_request()
+        
+        assert limiter._cached_usage == 2
+        assert limiter.can_make_request() == False
+    
+    def test_record_request_periodically_cleans_up(self, temp_db):
+        """Test that expired records are trimmed every CLEANUP_INTERVAL requests."""
+        limiter = RateLimiter(max_requests=10, time_window=86400, db_path=temp_db)
+        
+        with patch('src.rate_limiter.CLEANUP_INTERVAL', 3), \
+                patch.object(limiter, 'cleanup_old_records') as mock_cleanup:
+            for _ in range(7):
+                limiter.record_request()
+        
+        assert mock_cleanup.call_count == 2
+    
+    def test_services_are_counted_separately(self, temp_db):
+        """Test that usage is tracked per service name."""
+        api_limiter = RateLimiter(max_requests=5, time_window=86400,
+                                  db_path=temp_db, service_name="api")
+        other_limiter = RateLimiter(max_requests=5, time_window=86400,
+                                    db_path=temp_db, service_name="other")
+        
+        api_limiter.record_request()
+        
+        assert api_limiter.get_current_usage() == 1
+        assert other_limiter.get_current_usage() == 0
+    
+    def test_reset_clears_usage(self, temp_db):
+        """Test that reset clears recorded requests and cached usage."""
+        limiter = RateLimiter(max_requests=2, time_window=86400, db_path=temp_db)
+        limiter.record_request()
+        limiter.record_request()
+        
+        limiter.reset()
+        
+        assert limiter._cached_usage is None
+        assert limiter.can_make_request() == True
+        assert limiter.get_current_usage() == 0
+    
+    def test_short_window_counts_recent_requests(self, temp_db):
+        """Test that requests inside a sub-day window are counted."""
+        limiter = RateLimiter(max_requests=5, time_window=60, db_path=temp_db)
+        
+        limiter.record_request()
+        
+        assert limiter.get_current_usage() == 1
+    
+    def test_requests_outside_window_not_counted(self, temp_db):
+        """Test that expired requests no longer count towards usage."""
+        limiter = RateLimiter(max_requests=5, time_window=60, db_path=temp_db)
+        
+        with get_connection(temp_db) as conn:
+            conn.execute(
+                "INSERT INTO rate_limits (service_name, request_time) VALUES (?, ?)",
+                ("default", int(time.time()) - 300)
+            )
+        
+        assert limiter.get_current_usage() == 0
+        assert limiter.cleanup_old_records() == 1
+    
+    def test_reset_time_follows_oldest_request(self, temp_db):
+        """Test that the reset time is one window after the oldest request."""
+        limiter = RateLimiter(max_requests=5, time_window=60, db_path=temp_db)
+        before = datetime.now().replace(microsecond=0)
+        
+        limiter.record_request()
+        reset_time = limiter.get_reset_time()
+        
+        assert before + timedelta(seconds=60) <= reset_time
+        assert reset_time <= datetime.now() + timedelta(seconds=60)
+
+
+class TestRateLimitStorage:
+    """Test request time storage in the rate_limits table."""
+    
+    def test_request_time_stored_as_epoch(self, temp_db):
+        """Test that request times are stored as integer epoch seconds."""
+        limiter = RateLimiter(max_requests=5, time_window=60, db_path=temp_db)
+        limiter.record_request()
+        
+        with get_connection(temp_db) as conn:
+            row = conn.execute(
+                "SELECT typeof(request_time), request_time FROM rate_limits"
+            ).fetchone()
+        
+        assert row[0] == 'integer'
+        assert abs(row[1] - time.time()) < 5
+    
+    def test_legacy_text_timestamps_migrated(self, temp_db):
+        """Test that ISO timestamps from older versions are converted."""
+        legacy_time = datetime.now() - timedelta(seconds=10)
+        
+        with get_connection(temp_db) as conn:
+            conn.execute("""
+                CREATE TABLE rate_limits (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    service_name TEXT NOT NULL,
+                    request_time TIMESTAMP NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.execute(
+                "INSERT INTO rate_limits (service_name, request_time) VALUES (?, ?)",
+                ("default", legacy_time.isoformat(sep=' '))
+            )
+        
+        limiter = RateLimiter(max_requests=5, time_window=60, db_path=temp_db)
+        
+        assert limiter.get_current_usage() == 1
+    
+    def test_table_initialized_once_per_database(self, temp_db):
+        """Test that further limiters skip the table setup transaction."""
+        RateLimiter(max_requests=5, time_window=60, db_path=temp_db, service_name="a")
+        
+        with patch('src.rate_limiter.get_db_transaction') as mock_transaction:
+            RateLimiter(max_requests=5, time_window=60, db_path=temp_db, service_name="b")
+        
+        mock_transaction.assert_not_called()
@@ -0,0 +1,113 @@
+"""
+Tests for the monitoring scheduler in TixScanner.
+
+The price monitor and git backup are mocked, so no tasks, git commands or
+background threads run.
+"""
+
+from datetime import datetime, time as dt_time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.scheduler import MonitoringScheduler
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    """Create a scheduler whose git backup points at a temporary database path."""
+    with patch('src.scheduler.GitDatabaseBackup') as mock_backup:
+        monitoring_scheduler = MonitoringScheduler(MagicMock())
+    mock_backup.return_value.db_path = tmp_path / 'tickets.db'
+    return monitoring_scheduler
+
+
+class TestDatabaseRestore:
+    """Test the deferred restore of the database from git."""
+    
+    def test_init_does_not_restore(self, scheduler):
+        """Test that creating the scheduler leaves the restore for later."""
+        scheduler.git_backup.restore_database_from_git.assert_not_called()
+        assert scheduler._needs_restore == True
+    
+    def test_restore_when_database_missing(self, scheduler):
+        """Test that a missing database is restored, and only once."""
+        scheduler._restore_database_if_needed()
+        scheduler._restore_database_if_needed()
+        
+        scheduler.git_backup.restore_database_from_git.assert_called_once()
+        assert scheduler._needs_restore == False
+    
+    def test_restore_when_database_empty(self, scheduler):
+        """Test that an empty database file is treated like a missing one."""
+        scheduler.git_backup.db_path.touch()
+        
+        scheduler._restore_database_if_needed()
+        
+        scheduler.git_backup.restore_database_from_git.assert_called_once()
+    
+    def test_no_restore_when_database_present(self, scheduler):
+        """Test that a populated database skips the restore entirely."""
+        scheduler.git_backup.db_path.write_bytes(b'SQLite format 3\x00')
+        
+        scheduler._restore_database_if_needed()
+        
+        scheduler.git_backup.restore_database_from_git.assert_not_called()
+        assert scheduler._needs_restore == False
+    
+    def test_failed_restore_is_not_retried(self, scheduler):
+        """Test that a failing restore does not stop tasks or run again."""
+        scheduler.git_backup.restore_database_from_git.side_effect = Exception("no network")
+        
+        scheduler._restore_database_if_needed()
+        scheduler._restore_database_if_needed()
+        
+        scheduler.git_backup.restore_database_from_git.assert_called_once()
+    
+    def test_run_once_restores_before_tasks(self, scheduler):
+        """Test that a manual run restores the database before checking prices."""
+        calls = []
+        scheduler.git_backup.restore_database_from_git.side_effect = lambda: calls.append('restore')
+        scheduler.price_monitor.check_all_prices.side_effect = lambda: calls.append('check')
+        
+        scheduler.run_once()
+        
+        assert calls == ['restore', 'check']
+
+
+class TestScheduleBoundaries:
+    """Test the seconds-since-midnight schedule checks."""
+    
+    def test_summary_due_from_configured_second(self, scheduler):
+        """Test that the summary is due at exactly its time and not a second before."""
+        assert scheduler._should_send_summary(datetime(2030, 6, 1, 8, 59, 59)) == False
+        assert scheduler._should_send_summary(datetime(2030, 6, 1, 9, 0, 0)) == True
+        assert scheduler._should_send_summary(datetime(2030, 6, 1, 23, 59, 59)) == True
+    
+    def test_summary_sent_once_per_day(self, scheduler):
+        """Test that a summary sent today is not due again until tomorrow's time."""
+        scheduler._last_summary_date = datetime(2030, 6, 1).date()
+        
+        assert scheduler._should_send_summary(datetime(2030, 6, 1, 23, 59, 59)) == False
+        assert scheduler._should_send_summary(datetime(2030, 6, 2, 8, 59, 59)) == False
+        assert scheduler._should_send_summary(datetime(2030, 6, 2, 9, 0, 0)) == True
+    
+    def test_configure_updates_cached_thresholds(self, scheduler):
+        """Test that configured times with seconds move both thresholds."""
+        scheduler.configure(daily_summary_time=dt_time(18, 30, 15), backup_time=dt_time(2, 0, 0))
+        
+        assert scheduler._summary_sod == 18 * 3600 + 30 * 60 + 15
+        assert scheduler._should_send_summary(datetime(2030, 6, 1, 18, 30, 14)) == False
+        assert scheduler._should_send_summary(datetime(2030, 6, 1, 18, 30, 15)) == True
+        assert scheduler._should_backup_database(datetime(2030, 6, 1, 1, 59, 59)) == False
+        assert scheduler._should_backup_database(datetime(2030, 6, 1, 2, 0, 0)) == True
+    
+    def test_midnight_backup_due_at_start_of_day(self, scheduler):
+        """Test that the default midnight backup is due from the first second of the day."""
+        assert scheduler._backup_sod == 0
+        assert scheduler._should_backup_database(datetime(2030, 6, 1, 0, 0, 0)) == True
+        
+        scheduler._last_backup_date = datetime(2030, 6, 1).date()
+        
+        assert scheduler._should_backup_database(datetime(2030, 6, 1, 23, 59, 59)) == False
+        assert scheduler._should_backup_database(datetime(2030, 6, 2, 0, 0, 0)) == True
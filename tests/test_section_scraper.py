@@ -0,0 +1,656 @@
+"""
+Tests for the section-based scraper in TixScanner.
+
+These tests drive the scraper against mocked WebDrivers: price parsing,
+batched and trusted hovering, the network pricing fallback, result caching,
+driver pooling and connection setup. No browser is started.
+"""
+
+import json
+import subprocess
+import time
+
+import pytest
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from src.section_scraper import (
+    SectionBasedScraper, _DriverPool, _RESULT_CACHE, _cache_result, _css_string,
+    _merge_scrape_results, _quit_driver, _section_prices_from_json, _section_xpath, _timed,
+    _widen_connection_pool, _xpath_literal, resolve_chromedriver_path
+)
+
+
+@pytest.fixture
+def scraper():
+    """Create a scraper instance without starting a browser."""
+    return SectionBasedScraper.__new__(SectionBasedScraper)
+
+
+@pytest.fixture
+def live_scraper(scraper):
+    """Scraper with a mock driver and result caching disabled."""
+    scraper.driver = MagicMock()
+    scraper.driver.execute_script.return_value = False
+    scraper.wait = MagicMock()
+    scraper.cache_ttl = 0
+    scraper.reuse_driver = False
+    return scraper
+
+
+class TestPopupPriceExtraction:
+    """Test price extraction from hover popup text."""
+    
+    @pytest.mark.parametrize("popup_text, expected_price", [
+        ("$99.99", 99.99),
+        ("GENERAL ADMISSION\n$150.00+", 150.0),
+        ("Tickets from $45", 45.0),
+        ("Price: $120.50", 120.5),
+        ("75.00 USD", 75.0),
+        ("Starting at 60 dollars", 60.0),
+    ])
+    def test_extracts_price(self, scraper, popup_text, expected_price):
+        """Test that supported price formats are recognised."""
+        result = scraper._extract_price_from_element(popup_text)
+        
+        assert result['price'] == expected_price
+        assert result['text'] == popup_text
+        assert result['currency'] == 'USD'
+    
+    def test_no_price_returns_none(self, scraper):
+        """Test that popups without a price return None."""
+        assert scraper._extract_price_from_element("Sold out") is None
+
+
+class TestBatchSectionScrape:
+    """Test the single-call hover pass over all sections."""
+    
+    def test_batch_results_skip_per_section_hover(self, live_scraper):
+        """Test that sections priced by the batch pass are not hovered again."""
+        live_scraper.driver.execute_async_script.return_value = {
+            'Floor': 'FLOOR\n$85.00', 'Balcony': None
+        }
+        
+        with patch.object(SectionBasedScraper, '_handle_initial_popup'), \
+             patch.object(SectionBasedScraper, '_extract_section_price', return_value=None) as mock_single:
+            result = live_scraper.scrape_section_prices('https://example.com/event', ['Floor', 'Balcony'])
+        
+        assert result['success'] == True
+        assert result['sections']['Floor']['price'] == 85.0
+        assert result['sections']['Floor']['section'] == 'Floor'
+        mock_single.assert_called_once()
+        assert mock_single.call_args[0][0] == 'Balcony'
+    
+    def test_batch_restores_script_timeout(self, live_scraper):
+        """Test that the longer batch timeout does not stay on the driver."""
+        live_scraper.driver.timeouts.script = 30
+        live_scraper.driver.execute_async_script.side_effect = TimeoutException()
+        
+        assert live_scraper._extract_all_sections_js(['A', 'B'], max_wait=5) == {}
+        
+        timeouts = [c.args[0] for c in live_scraper.driver.set_script_timeout.call_args_list]
+        assert timeouts == [17, 30]
+    
+    def test_page_loading_is_not_stopped(self, live_scraper):
+        """Test that in-flight pricing requests are not aborted once the map renders."""
+        live_scraper.driver.execute_async_script.return_value = {'Floor': 'FLOOR\n$85.00'}
+        
+        with patch.object(SectionBasedScraper, '_handle_initial_popup'):
+            live_scraper.scrape_section_prices('https://example.com/event', ['Floor'])
+        
+        scripts = [c.args[0] for c in live_scraper.driver.execute_script.call_args_list]
+        assert not any('window.stop' in script for script in scripts)
+    
+    def test_single_section_hover_reads_popup_in_one_call(self, live_scraper):
+        """Test that a section is hovered and its popup read in one script call."""
+        live_scraper.driver.execute_async_script.return_value = 'FLOOR\n$85.00'
+        
+        result = live_scraper._extract_section_price('Floor', section_element=MagicMock())
+        
+        assert result['price'] == 85.0
+        assert result['section'] == 'Floor'
+        live_scraper.driver.execute_async_script.assert_called_once()
+    
+    def test_trusted_hover_when_synthetic_events_show_no_popup(self, live_scraper):
+        """Test that a real mouse hover is tried when dispatched events open no popup."""
+        section = MagicMock()
+        live_scraper.driver.execute_async_script.side_effect = [None, 'FLOOR\n$85.00']
+        live_scraper.driver.execute_script.return_value = {'x': 640, 'y': 360}
+        
+        result = live_scraper._extract_section_price('Floor', section_element=section)
+        
+        assert result['price'] == 85.0
+        assert live_scraper.driver.execute_script.call_args.args[1] is section
+        assert live_scraper.driver.execute_cdp_cmd.call_args_list == [
+            (('Input.dispatchMouseEvent', {'type': 'mouseMoved', 'x': 640, 'y': 360}),),
+            (('Input.dispatchMouseEvent', {'type': 'mouseMoved', 'x': 0, 'y': 0}),),
+        ]
+    
+    def test_batch_miss_goes_straight_to_trusted_hover(self, live_scraper):
+        """Test that a section the batch hovered without a popup is not sent events again."""
+        live_scraper.driver.execute_async_script.side_effect = [{'Floor': None}, 'FLOOR\n$85.00']
+        live_scraper.driver.execute_script.side_effect = [False, None, {'Floor': MagicMock()}, {'x': 640, 'y': 360}]
+        
+        with patch.object(SectionBasedScraper, '_handle_initial_popup'):
+            result = live_scraper.scrape_section_prices('https://example.com/event', ['Floor'])
+        
+        assert result['sections']['Floor']['price'] == 85.0
+        assert live_scraper.driver.execute_async_script.call_count == 2
+        live_scraper.driver.execute_cdp_cmd.assert_any_call(
+            'Input.dispatchMouseEvent', {'type': 'mouseMoved', 'x': 640, 'y': 360}
+        )
+    
+    def test_unavailable_section_is_not_hovered_again(self, live_scraper):
+        """Test that sections reported unavailable skip the real mouse hover."""
+        live_scraper.driver.execute_async_script.return_value = False
+        
+        live_scraper._extract_section_price('Pit', section_element=MagicMock())
+        
+        live_scraper.driver.execute_cdp_cmd.assert_not_called()
+    
+    def test_unavailable_single_section_returns_none(self, live_scraper):
+        """Test that a section the page reports as unavailable is skipped."""
+        live_scraper.driver.execute_async_script.return_value = False
+        
+        assert live_scraper._extract_section_price('Pit', section_element=MagicMock()) is None
+    
+    def test_index_miss_only_tries_text_fallback(self, live_scraper):
+        """Test that sections missing from the index skip the attribute search."""
+        live_scraper.driver.find_element.side_effect = NoSuchElementException()
+        
+        assert live_scraper._extract_section_price('Nope', search_attributes=False) is None
+        live_scraper.driver.find_elements.assert_not_called()
+        live_scraper.driver.find_element.assert_called_once()
+
+
+class TestInitialPopup:
+    """Test dismissal of the consent dialog."""
+    
+    def test_map_without_modal_returns_at_once(self, live_scraper):
+        """Test that a rendered map with no visible modal skips the accept wait."""
+        live_scraper.driver.execute_script.return_value = False
+        
+        live_scraper._handle_initial_popup()
+        
+        live_scraper.wait.until.assert_called_once()
+        live_scraper.driver.find_element.assert_not_called()
+    
+    def test_late_block_page_stops_scrape(self, live_scraper):
+        """Test that a block page shown instead of the map ends the scrape."""
+        live_scraper.wait.until.side_effect = TimeoutException()
+        live_scraper.driver.execute_script.side_effect = [False, True]
+        
+        with patch.object(SectionBasedScraper, '_handle_initial_popup'):
+            result = live_scraper.scrape_section_prices('https://example.com/event', ['Floor'])
+        
+        assert result['success'] == False
+        assert 'Access denied' in result['error']
+        live_scraper.driver.execute_async_script.assert_not_called()
+
+
+class TestResultCache:
+    """Test reuse of recent scrape results."""
+    
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        """Start every test with an empty result cache."""
+        with patch.dict('src.section_scraper._RESULT_CACHE', clear=True):
+            yield
+    
+    def _scrape(self, scraper, sections, **kwargs):
+        with patch.object(SectionBasedScraper, '_handle_initial_popup'):
+            return scraper.scrape_section_prices('https://example.com/event', sections, **kwargs)
+    
+    def test_section_order_shares_cache_entry(self, live_scraper):
+        """Test that the same sections in another order hit the cache."""
+        live_scraper.cache_ttl = 60
+        live_scraper.driver.execute_async_script.return_value = {'A': '$10.00', 'B': '$20.00'}
+        
+        first = self._scrape(live_scraper, ['A', 'B'])
+        second = self._scrape(live_scraper, ['B', 'A'])
+        
+        assert second == first
+        live_scraper.driver.get.assert_called_once()
+    
+    def test_force_refresh_bypasses_cache(self, live_scraper):
+        """Test that force_refresh always loads the page."""
+        live_scraper.cache_ttl = 60
+        live_scraper.driver.execute_async_script.return_value = {'A': '$10.00'}
+        
+        self._scrape(live_scraper, ['A'])
+        self._scrape(live_scraper, ['A'], force_refresh=True)
+        
+        assert live_scraper.driver.get.call_count == 2
+    
+    @patch('src.section_scraper.RESULT_CACHE_MAXSIZE', 2)
+    def test_oldest_entry_evicted_when_full(self):
+        """Test that the cache never grows beyond its maximum size."""
+        for index in range(3):
+            _cache_result((f'url{index}', ()), {'scraped_at': time.time()}, ttl=60)
+        
+        assert list(_RESULT_CACHE) == [('url1', ()), ('url2', ())]
+
+
+class TestNetworkPricing:
+    """Test pricing read from captured network responses."""
+    
+    def test_lowest_price_per_section(self):
+        """Test that facets are reduced to each section's lowest price."""
+        payload = {'facets': [
+            {'section': 'FLOOR A', 'listPriceRange': [{'currency': 'USD', 'min': 120.5, 'max': 300}]},
+            {'section': 'floor  a', 'listPriceRange': [{'currency': 'USD', 'min': 95.0, 'max': 95.0}]},
+            {'section': 'Balcony', 'listPriceRange': [{'currency': 'USD', 'min': 40, 'max': 60}]},
+        ]}
+        
+        prices = _section_prices_from_json([payload], ['Floor A', 'Balcony', 'Pit'])
+        
+        assert prices['Floor A']['price'] == 95.0
+        assert prices['Floor A']['section'] == 'Floor A'
+        assert prices['Balcony']['price'] == 40.0
+        assert 'Pit' not in prices
+    
+    def test_ignores_objects_without_prices(self):
+        """Test that facets with no usable price, or sold out, are skipped."""
+        payload = {'facets': [
+            {'section': 'Floor', 'listPriceRange': [{'min': None}, {'min': True}]},
+            {'section': 'Floor', 'available': False, 'listPriceRange': [{'min': 30}]},
+        ]}
+        
+        assert _section_prices_from_json([payload], ['Floor']) == {}
+    
+    def test_section_name_must_match_exactly(self):
+        """Test that a section never takes the price of a longer name containing it."""
+        payload = {'facets': [
+            {'section': 'Section 1012', 'listPriceRange': [{'min': 25}]},
+            {'section': 'Row A', 'listPriceRange': [{'min': 15}]},
+        ]}
+        
+        assert _section_prices_from_json([payload], ['101', 'Section 101', 'A']) == {}
+    
+    def test_other_response_layouts_are_ignored(self):
+        """Test that generic objects naming a section and a price are not trusted."""
+        payload = {'_embedded': {'offer': [{'section': 'Floor', 'listPrice': 20.0}]},
+                   'name': 'Floor', 'price': 10}
+        
+        assert _section_prices_from_json([payload], ['Floor']) == {}
+    
+    def test_hover_price_is_not_overridden(self, live_scraper):
+        """Test that network prices are not read for sections a hover priced."""
+        live_scraper.driver.execute_async_script.return_value = {'Floor': 'FLOOR\n$85.00'}
+        
+        with patch.object(SectionBasedScraper, '_handle_initial_popup'), \
+             patch.object(SectionBasedScraper, '_capture_pricing_responses') as mock_capture:
+            result = live_scraper.scrape_section_prices('https://example.com/event', ['Floor'])
+        
+        assert result['sections']['Floor']['price'] == 85.0
+        mock_capture.assert_not_called()
+    
+    def test_network_price_used_when_hover_fails(self, live_scraper):
+        """Test that sections with no tooltip fall back to the facets response."""
+        live_scraper.driver.execute_async_script.return_value = {'Floor': 'FLOOR\n$85.00', 'Pit': None}
+        facets = {'facets': [
+            {'section': 'Floor', 'listPriceRange': [{'min': 10}]},
+            {'section': 'Pit', 'listPriceRange': [{'min': 150}]},
+        ]}
+        
+        with patch.object(SectionBasedScraper, '_handle_initial_popup'), \
+             patch.object(SectionBasedScraper, '_extract_section_price', return_value=None), \
+             patch.object(SectionBasedScraper, '_capture_pricing_responses', return_value=[facets]):
+            result = live_scraper.scrape_section_prices('https://example.com/event', ['Floor', 'Pit'])
+        
+        assert result['sections']['Floor']['price'] == 85.0
+        assert result['sections']['Pit']['price'] == 150.0
+    
+    @staticmethod
+    def _document_entry(url, loader_id):
+        return {'message': json.dumps({'message': {
+            'method': 'Network.requestWillBeSent',
+            'params': {'requestId': loader_id, 'loaderId': loader_id, 'frameId': 'main',
+                       'type': 'Document', 'request': {'url': url}}
+        }})}
+    
+    @staticmethod
+    def _response_entry(url, mime, request_id, loader_id):
+        return {'message': json.dumps({'message': {
+            'method': 'Network.responseReceived',
+            'params': {'requestId': request_id, 'loaderId': loader_id,
+                       'response': {'url': url, 'mimeType': mime}}
+        }})}
+    
+    def test_capture_reads_matching_json_responses(self, scraper):
+        """Test that only JSON pricing responses have their bodies fetched."""
+        scraper.driver = MagicMock()
+        scraper.driver.get_log.return_value = [
+            self._document_entry('https://example.com/event', 'L1'),
+            self._response_entry('https://services.ticketmaster.com/api/ismds/event/1/facets',
+                                 'application/json', '1', 'L1'),
+            self._response_entry('https://www.ticketmaster.com/logo.png', 'image/png', '2', 'L1'),
+        ]
+        scraper.driver.execute_cdp_cmd.return_value = {'body': '{"facets": []}'}
+        
+        payloads = scraper._capture_pricing_responses('https://example.com/event')
+        
+        assert payloads == [{'facets': []}]
+        scraper.driver.execute_cdp_cmd.assert_called_once_with('Network.getResponseBody', {'requestId': '1'})
+    
+    def test_capture_skips_responses_from_earlier_pages(self, scraper):
+        """Test that late responses for the previous event are not read for this one."""
+        scraper.driver = MagicMock()
+        scraper.driver.get_log.return_value = [
+            self._response_entry('https://services.ticketmaster.com/api/ismds/event/0/facets',
+                                 'application/json', '7', 'OLD'),
+            self._document_entry('https://example.com/event', 'L1'),
+            self._response_entry('https://services.ticketmaster.com/api/ismds/event/0/facets',
+                                 'application/json', '8', 'OLD'),
+        ]
+        
+        assert scraper._capture_pricing_responses('https://example.com/event') == []
+        scraper.driver.execute_cdp_cmd.assert_not_called()
+    
+    def test_capture_without_navigation_reads_nothing(self, scraper):
+        """Test that no responses are trusted when the page's own request is missing."""
+        scraper.driver = MagicMock()
+        scraper.driver.get_log.return_value = [
+            self._response_entry('https://services.ticketmaster.com/api/ismds/event/0/facets',
+                                 'application/json', '7', 'OLD'),
+        ]
+        
+        assert scraper._capture_pricing_responses('https://example.com/event') == []
+    
+    def test_log_cleared_before_navigation(self, live_scraper):
+        """Test that entries buffered by an earlier scrape are drained before the page loads."""
+        calls = []
+        live_scraper.driver.get_log.side_effect = lambda log_type: calls.append('get_log') or []
+        live_scraper.driver.get.side_effect = lambda url: calls.append('get')
+        live_scraper.driver.execute_async_script.return_value = {'Floor': '$85.00'}
+        
+        with patch.object(SectionBasedScraper, '_handle_initial_popup'):
+            live_scraper.scrape_section_prices('https://example.com/event', ['Floor'])
+        
+        assert calls == ['get_log', 'get']
+
+
+class TestDriverPool:
+    """Test reuse of idle WebDrivers."""
+    
+    def test_acquire_empty_pool_returns_none(self):
+        """Test that an empty pool has nothing to lend."""
+        assert _DriverPool().acquire() is None
+    
+    def test_released_driver_is_reused(self):
+        """Test that a released driver is handed to the next borrower."""
+        pool = _DriverPool()
+        driver = MagicMock()
+        
+        assert pool.release(driver) == True
+        assert pool.acquire() is driver
+        assert pool.acquire() is None
+    
+    def test_release_when_full_is_refused(self):
+        """Test that the pool does not grow beyond max_idle."""
+        pool = _DriverPool(max_idle=1)
+        
+        assert pool.release(MagicMock()) == True
+        assert pool.release(MagicMock()) == False
+    
+    def test_dead_driver_is_discarded(self):
+        """Test that drivers whose browser has gone away are quit, not lent."""
+        pool = _DriverPool()
+        dead_driver = MagicMock()
+        type(dead_driver).current_url = PropertyMock(side_effect=Exception("gone"))
+        pool.release(dead_driver)
+        
+        assert pool.acquire() is None
+        dead_driver.quit.assert_called_once()
+    
+    @patch('src.section_scraper.time.sleep')
+    def test_quit_returns_once_process_exits(self, mock_sleep):
+        """Test that quitting waits on the process rather than a fixed delay."""
+        driver = MagicMock()
+        
+        _quit_driver(driver)
+        
+        driver.quit.assert_called_once()
+        driver.service.process.wait.assert_called_once_with(timeout=2.0)
+        driver.service.process.kill.assert_not_called()
+        mock_sleep.assert_not_called()
+    
+    def test_pooled_driver_has_no_implicit_wait(self, scraper):
+        """Test that borrowed drivers fail lookups at once instead of waiting."""
+        driver = MagicMock()
+        scraper.reuse_driver = True
+        scraper.headless = True
+        scraper.timeout = 20
+        scraper.short_timeout = 8
+        
+        with patch.object(_DriverPool, 'acquire', return_value=driver):
+            scraper._setup_driver()
+        
+        assert scraper.driver is driver
+        driver.implicitly_wait.assert_called_once_with(0)
+    
+    def test_quit_kills_process_that_does_not_exit(self):
+        """Test that a chromedriver stuck after quit is killed."""
+        driver = MagicMock()
+        driver.service.process.wait.side_effect = subprocess.TimeoutExpired('chromedriver', 2)
+        
+        _quit_driver(driver)
+        
+        driver.service.process.kill.assert_called_once()
+
+
+class TestScrapeEvents:
+    """Test scraping several events on pooled browser sessions."""
+    
+    @patch.object(SectionBasedScraper, 'close')
+    @patch.object(SectionBasedScraper, '_setup_driver')
+    def test_every_url_is_scraped_once(self, mock_setup, mock_close):
+        """Test that workers share the event queue without repeating work."""
+        urls_sections = [(f'https://example.com/event/{i}', ['Floor']) for i in range(5)]
+        
+        with patch.object(SectionBasedScraper, 'scrape_section_prices',
+                          side_effect=lambda url, sections=None, prefetch_urls=None: {'url': url, 'success': True}) as mock_scrape:
+            results = SectionBasedScraper.scrape_events(urls_sections, concurrency=2)
+        
+        assert set(results) == {url for url, _ in urls_sections}
+        assert all(r['success'] for r in results.values())
+        assert mock_scrape.call_count == 5
+        assert mock_setup.call_count == 2
+        assert mock_close.call_count == 2
+    
+    @patch.object(SectionBasedScraper, 'close')
+    @patch.object(SectionBasedScraper, '_setup_driver')
+    def test_single_session_prefetches_next_event(self, mock_setup, mock_close):
+        """Test that one session scrapes in order and prefetches the following event."""
+        with patch.object(SectionBasedScraper, 'scrape_section_prices',
+                          return_value={'success': True}) as mock_scrape:
+            SectionBasedScraper.scrape_events([
+                ('https://example.com/event/1', ['Floor']),
+                ('https://example.com/event/2', ['Balcony']),
+            ])
+        
+        assert [call.kwargs['sections'] for call in mock_scrape.call_args_list] == [['Floor'], ['Balcony']]
+        prefetched = [call.kwargs['prefetch_urls'] for call in mock_scrape.call_args_list]
+        assert prefetched == [['https://example.com/event/2'], []]
+        assert mock_setup.call_count == 1
+    
+    @patch.object(SectionBasedScraper, '_setup_driver', side_effect=Exception("no chrome"))
+    def test_failed_browser_start_reports_errors(self, mock_setup):
+        """Test that events are still reported when no browser could start."""
+        results = SectionBasedScraper.scrape_events([('https://example.com/event/1', ['Floor'])])
+        
+        assert results['https://example.com/event/1']['success'] == False
+        assert results['https://example.com/event/1']['error'] == "No browser session available"
+    
+    def test_no_events(self):
+        """Test that nothing is started without events."""
+        assert SectionBasedScraper.scrape_events([]) == {}
+    
+    @patch.object(SectionBasedScraper, 'close')
+    @patch.object(SectionBasedScraper, '_setup_driver')
+    def test_sections_are_sharded_and_merged(self, mock_setup, mock_close):
+        """Test that one event's sections are split across sessions and combined."""
+        def fake_scrape(url, sections=None, prefetch_urls=None):
+            return {'url': url, 'scraped_at': time.time(), 'success': True, 'error': None,
+                    'sections': {name: {'price': 10.0, 'section': name} for name in sections}}
+        
+        with patch.object(SectionBasedScraper, 'scrape_section_prices', side_effect=fake_scrape) as mock_scrape:
+            results = SectionBasedScraper.scrape_events(
+                [('https://example.com/event', ['A', 'B', 'C'])], concurrency=2, section_shards=2
+            )
+        
+        result = results['https://example.com/event']
+        assert result['success'] == True
+        assert set(result['sections']) == {'A', 'B', 'C'}
+        assert sorted(len(c.kwargs['sections']) for c in mock_scrape.call_args_list) == [1, 2]
+        assert all(c.kwargs['prefetch_urls'] == [] for c in mock_scrape.call_args_list)
+        assert mock_setup.call_count == 2
+    
+    def test_merge_reports_unscraped_shard(self):
+        """Test that a chunk no session ran is reported while the rest is kept."""
+        scraped = {'url': 'https://example.com/event', 'scraped_at': 100.0, 'success': True, 'error': None,
+                   'sections': {'A': {'price': 10.0, 'section': 'A'}}}
+        
+        result = _merge_scrape_results('https://example.com/event', [scraped, None])
+        
+        assert result['success'] == True
+        assert list(result['sections']) == ['A']
+        assert result['error'] == "No browser session available"
+        assert result['scraped_at'] == 100.0
+
+
+class TestSharedScraper:
+    """Test the process-wide shared scraper."""
+    
+    @patch.object(SectionBasedScraper, '_setup_driver')
+    def test_get_shared_returns_same_instance(self, mock_setup):
+        """Test that repeated calls reuse one scraper and one browser."""
+        with patch.dict('src.section_scraper._SHARED_SCRAPERS', clear=True):
+            first = SectionBasedScraper.get_shared(headless=True, timeout=30)
+            first.driver = MagicMock()
+            second = SectionBasedScraper.get_shared(headless=True, timeout=30)
+            other = SectionBasedScraper.get_shared(headless=True, timeout=10)
+        
+        assert first is second
+        assert other is not first
+        assert mock_setup.call_count == 2
+    
+    @patch.object(SectionBasedScraper, '_setup_driver')
+    def test_get_shared_restarts_closed_scraper(self, mock_setup):
+        """Test that a shared scraper closed by a caller gets a new driver."""
+        with patch.dict('src.section_scraper._SHARED_SCRAPERS', clear=True):
+            first = SectionBasedScraper.get_shared()
+            second = SectionBasedScraper.get_shared()
+        
+        assert first is second
+        assert mock_setup.call_count == 2
+    
+    @patch.object(SectionBasedScraper, '_setup_driver')
+    def test_get_shared_uses_profile_from_environment(self, mock_setup, monkeypatch):
+        """Test that the shared scraper keeps its profile when one is configured."""
+        monkeypatch.setenv('TIXSCANNER_CHROME_PROFILE', '/tmp/tixscanner-profile')
+        with patch.dict('src.section_scraper._SHARED_SCRAPERS', clear=True):
+            scraper = SectionBasedScraper.get_shared()
+        
+        assert scraper.profile_dir == '/tmp/tixscanner-profile'
+        assert scraper.reuse_driver == False
+
+
+class TestChromeDriverPath:
+    """Test ChromeDriver path resolution."""
+    
+    @pytest.fixture(autouse=True)
+    def clear_path_cache(self):
+        """Resolve the path afresh in every test."""
+        resolve_chromedriver_path.cache_clear()
+        yield
+        resolve_chromedriver_path.cache_clear()
+    
+    @patch('src.section_scraper.os.path.exists', return_value=False)
+    @patch('src.section_scraper.ChromeDriverManager')
+    def test_install_runs_once(self, mock_manager, mock_exists):
+        """Test that webdriver-manager is only consulted on first use."""
+        mock_manager.return_value.install.return_value = '/tmp/chromedriver'
+        
+        assert resolve_chromedriver_path() == '/tmp/chromedriver'
+        assert resolve_chromedriver_path() == '/tmp/chromedriver'
+        
+        mock_manager.return_value.install.assert_called_once()
+    
+    @patch('src.section_scraper.ChromeDriverManager')
+    def test_environment_override(self, mock_manager, tmp_path, monkeypatch):
+        """Test that CHROMEDRIVER_PATH skips webdriver-manager entirely."""
+        driver_path = tmp_path / 'chromedriver'
+        driver_path.write_text('')
+        driver_path.chmod(0o755)
+        monkeypatch.setenv('CHROMEDRIVER_PATH', str(driver_path))
+        
+        assert resolve_chromedriver_path() == str(driver_path)
+        mock_manager.assert_not_called()
+
+
+class TestConnectionPool:
+    """Test WebDriver HTTP connection pool sizing."""
+    
+    def test_connection_pool_is_widened(self):
+        """Test that the driver's HTTP pool allows concurrent commands."""
+        driver = MagicMock()
+        driver.command_executor = RemoteConnection(
+            client_config=ClientConfig(remote_server_addr="http://127.0.0.1:9515")
+        )
+        
+        _widen_connection_pool(driver, maxsize=16)
+        
+        assert driver.command_executor._conn.connection_pool_kw['maxsize'] == 16
+
+
+class TestSectionSelectors:
+    """Test selector construction for section lookup."""
+    
+    @pytest.mark.parametrize("value, expected", [
+        ("Floor", "'Floor'"),
+        ("Fan's Pit", '"Fan\'s Pit"'),
+        ("5'11\" Club", "concat('5', \"'\", '11\" Club')"),
+    ])
+    def test_xpath_literal_quoting(self, value, expected):
+        """Test that any mix of quotes produces a valid XPath literal."""
+        assert _xpath_literal(value) == expected
+    
+    def test_section_xpath_matches_text(self):
+        """Test that the XPath fallback searches text content for the name."""
+        assert _section_xpath("Floor A") == "(//*[contains(text(), 'Floor A')])[1]"
+    
+    @pytest.mark.parametrize("value, expected", [
+        ("Floor", '"Floor"'),
+        ('Club "A"', '"Club \\"A\\""'),
+        ("Back\\slash", '"Back\\\\slash"'),
+        ("Upper\nDeck", '"Upper\\a Deck"'),
+        ("Tab\tSection", '"Tab\\9 Section"'),
+    ])
+    def test_css_string_quoting(self, value, expected):
+        """Test that section names are safely quoted for CSS selectors."""
+        assert _css_string(value) == expected
+
+
+class TestTimedPhases:
+    """Test debug timing of scrape phases."""
+    
+    def test_phase_duration_is_logged(self, caplog):
+        """Test that a timed block logs its phase name and duration."""
+        with caplog.at_level('DEBUG', logger='src.section_scraper'):
+            with _timed("map_wait"):
+                pass
+        
+        assert any(record.getMessage().startswith("map_wait took ") for record in caplog.records)
+    
+    def test_phase_logged_when_block_raises(self, caplog):
+        """Test that failing phases are still timed."""
+        with caplog.at_level('DEBUG', logger='src.section_scraper'):
+            with pytest.raises(ValueError):
+                with _timed("page_load"):
+                    raise ValueError("boom")
+        
+        assert any("page_load took" in record.getMessage() for record in caplog.records)
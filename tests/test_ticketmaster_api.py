@@ -0,0 +1,174 @@
+"""
+Tests for the Ticketmaster API client in TixScanner.
+
+Requests, the cache and the rate limiter are mocked, so no network or
+database access happens.
+"""
+
+import json
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.ticketmaster_api import TicketmasterAPI, TicketmasterAPIError, _cache_key, orjson
+
+
+@pytest.fixture
+def api():
+    """Create an API client with mocked session, cache and rate limiter."""
+    client = TicketmasterAPI.__new__(TicketmasterAPI)
+    client.api_key = 'secret-key'
+    client.session = MagicMock()
+    client.cache = MagicMock()
+    client.cache.get.return_value = None
+    client.rate_limiter = MagicMock()
+    client.rate_limiter.can_make_request.return_value = True
+    return client
+
+
+class TestCacheKey:
+    """Test cache key construction."""
+    
+    def test_parameter_order_does_not_matter(self):
+        """Test that the same parameters in any order give the same key."""
+        url = 'https://app.ticketmaster.com/discovery/v2/events'
+        
+        assert _cache_key(url, {'size': 1, 'keyword': 'x'}) == _cache_key(url, {'keyword': 'x', 'size': 1})
+    
+    def test_api_key_is_left_out(self):
+        """Test that the API key never appears in the cache key."""
+        key = _cache_key('https://example.com/events', {'apikey': 'secret-key', 'size': 1})
+        
+        assert key == 'https://example.com/events?size=1'
+    
+    def test_request_does_not_modify_params(self, api):
+        """Test that the caller's parameters are not given the API key."""
+        api.session.get.return_value = MagicMock(status_code=200, content=b'{}',
+                                                  json=MagicMock(return_value={}))
+        params = {'size': 1}
+        
+        api._make_request('/events', params)
+        
+        assert params == {'size': 1}
+        assert 'secret-key' not in api.cache.get.call_args[0][0]
+
+
+class TestResponseParsing:
+    """Test decoding of successful responses."""
+    
+    @pytest.mark.skipif(orjson is None, reason="orjson not installed")
+    def test_parses_response_body_with_orjson(self, api):
+        """Test that the raw response body is decoded by orjson."""
+        api.session.get.return_value = MagicMock(status_code=200, content=b'{"id": "E1"}')
+        
+        assert api._make_request('/events/E1') == {'id': 'E1'}
+    
+    @patch('src.ticketmaster_api.orjson', None)
+    def test_falls_back_to_stdlib_json(self, api):
+        """Test that responses still parse when orjson is not installed."""
+        response = MagicMock(status_code=200)
+        response.json.return_value = {'id': 'E1'}
+        api.session.get.return_value = response
+        
+        assert api._make_request('/events/E1') == {'id': 'E1'}
+        response.json.assert_called_once()
+    
+    def test_invalid_json_raises_api_error(self, api):
+        """Test that a 200 response with a non-JSON body raises TicketmasterAPIError."""
+        response = MagicMock(status_code=200, content=b'<html>Service unavailable</html>')
+        response.json.side_effect = ValueError("Expecting value")
+        api.session.get.return_value = response
+        
+        with pytest.raises(TicketmasterAPIError):
+            api._make_request('/events/E1')
+        api.cache.set.assert_not_called()
+
+
+class TestEventDetails:
+    """Test fetching and caching of single events."""
+    
+    EVENT = {
+        'id': 'E1',
+        'name': 'Test Concert',
+        'priceRanges': [{'type': 'standard', 'currency': 'USD', 'min': 50.0, 'max': 150.0}]
+    }
+    
+    def test_parsed_details_are_cached(self, api):
+        """Test that the parsed event is cached rather than the raw response."""
+        api.session.get.return_value = MagicMock(status_code=200, content=json.dumps(self.EVENT).encode(),
+                                                  json=MagicMock(return_value=self.EVENT))
+        
+        event = api.get_event_details('E1')
+        
+        assert event['name'] == 'Test Concert'
+        api.cache.set.assert_called_once_with('event:E1', event)
+    
+    def test_cache_hit_skips_request(self, api):
+        """Test that a cached event is returned without calling the API."""
+        api.cache.get.return_value = {'id': 'E1', 'name': 'Cached'}
+        
+        assert api.get_event_details('E1')['name'] == 'Cached'
+        api.session.get.assert_not_called()
+    
+    def test_ticket_prices_come_from_parsed_event(self, api):
+        """Test that ticket prices are shaped while the event is parsed."""
+        api.session.get.return_value = MagicMock(status_code=200, content=json.dumps(self.EVENT).encode(),
+                                                  json=MagicMock(return_value=self.EVENT))
+        
+        prices = api.get_ticket_prices('E1')
+        
+        assert prices == [{
+            'section': 'standard',
+            'price': 50.0,
+            'price_max': 150.0,
+            'currency': 'USD',
+            'type': 'primary',
+            'availability': 'available'
+        }]
+        api.session.get.assert_called_once()
+    
+    def test_missing_max_price_uses_min(self, api):
+        """Test that a price range with a null max still parses, keeping the event."""
+        event = api._parse_event_details({
+            'id': 'E1', 'name': 'Test Concert',
+            'priceRanges': [{'type': 'standard', 'currency': 'USD', 'min': 50.0, 'max': None}]
+        })
+        
+        assert event['name'] == 'Test Concert'
+        assert event['prices'][0]['price_max'] == 50.0
+    
+    def test_malformed_prices_do_not_drop_event(self, api):
+        """Test that unparseable prices only cost the prices, not the event."""
+        event = api._parse_event_details({
+            'id': 'E1', 'name': 'Test Concert',
+            'priceRanges': [{'type': 'standard', 'min': 'TBA'}]
+        })
+        
+        assert event['name'] == 'Test Concert'
+        assert event['prices'] == []
+
+
+class TestBulkEvents:
+    """Test fetching several events in one request."""
+    
+    def test_uncached_events_fetched_in_one_request(self, api):
+        """Test that uncached events share a request and are cached one by one."""
+        api.cache.get_many.return_value = {'event:E1': {'id': 'E1', 'name': 'Cached'}}
+        body = {'_embedded': {'events': [{'id': 'E2', 'name': 'Two'}, {'id': 'E3', 'name': 'Three'}]}}
+        api.session.get.return_value = MagicMock(status_code=200, content=json.dumps(body).encode(),
+                                                  json=MagicMock(return_value=body))
+        
+        events = api.get_events_bulk(['E1', 'E2', 'E3'])
+        
+        assert sorted(events) == ['E1', 'E2', 'E3']
+        api.session.get.assert_called_once()
+        assert api.session.get.call_args.kwargs['params']['id'] == 'E2,E3'
+        assert list(api.cache.set_many.call_args[0][0]) == ['event:E2', 'event:E3']
+    
+    def test_all_cached_makes_no_request(self, api):
+        """Test that no request is made when every event is cached."""
+        api.cache.get_many.return_value = {'event:E1': {'id': 'E1'}}
+        
+        assert api.get_events_bulk(['E1', 'E1']) == {'E1': {'id': 'E1'}}
+        api.cache.get_many.assert_called_once_with(['event:E1'])
+        api.session.get.assert_not_called()